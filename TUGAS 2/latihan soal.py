@@ -2,7 +2,19 @@
 #                   LATIHAN SOAL - PYTHON
 # ============================================================
 
+import bisect
+import csv
+import heapq
+import itertools
+import json
+import mmap
 import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import Counter, defaultdict
 
 def bersihkan_layar():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -54,6 +66,94 @@ def cek_anagram(kata1: str, kata2: str) -> bool:
     return hitung_karakter(kata1) == hitung_karakter(kata2)
 
 
+# ============================================================
+# SOAL 3b — ANAGRAM DALAM TEKS (SLIDING WINDOW)
+# Mencari semua posisi di mana permutasi `pola` muncul di dalam teks.
+# Hitungan karakter jendela diperbarui O(1) per geseran, bukan
+# memanggil cek_anagram ulang untuk setiap jendela (O(n·m)).
+# ============================================================
+
+def _posisi_anagram(potongan_iter, pola):
+    """
+    Inti rolling count. `potongan_iter` menghasilkan potongan teks yang
+    berurutan (sejenis dengan `pola`: str atau bytes). Yield posisi awal
+    global dari setiap jendela sepanjang len(pola) yang anagram dari pola.
+    """
+    m = len(pola)
+    if m == 0:
+        return
+
+    # bytes → vektor hitungan 256 slot, str → dict seperti hitung_karakter
+    if isinstance(pola, (bytes, bytearray)):
+        kebutuhan, jendela = [0] * 256, [0] * 256
+    else:
+        kebutuhan, jendela = defaultdict(int), defaultdict(int)
+    for huruf in pola:
+        kebutuhan[huruf] += 1
+
+    # selisih = banyaknya simbol yang hitungannya di jendela ≠ di pola
+    selisih = len(set(pola))
+    dibaca = 0          # total simbol yang sudah masuk jendela
+    offset = 0          # posisi global dari buffer[0]
+    ekor = pola[:0]     # sisa m simbol terakhir dari potongan sebelumnya
+
+    for potongan in potongan_iter:
+        if not potongan:
+            continue
+        buffer = ekor + potongan
+        for j in range(len(ekor), len(buffer)):
+            # simbol masuk
+            huruf = buffer[j]
+            sebelum = jendela[huruf]
+            jendela[huruf] = sebelum + 1
+            target = kebutuhan[huruf]
+            if sebelum == target:
+                selisih += 1
+            elif sebelum + 1 == target:
+                selisih -= 1
+            dibaca += 1
+
+            # simbol keluar (boleh berada di potongan sebelumnya, lewat ekor)
+            if dibaca > m:
+                huruf = buffer[j - m]
+                sebelum = jendela[huruf]
+                jendela[huruf] = sebelum - 1
+                target = kebutuhan[huruf]
+                if sebelum == target:
+                    selisih += 1
+                elif sebelum - 1 == target:
+                    selisih -= 1
+
+            if dibaca >= m and selisih == 0:
+                yield offset + j - m + 1
+
+        ekor = buffer[-m:]
+        offset += len(buffer) - len(ekor)
+
+
+def cari_anagram(teks: str, pola: str) -> list:
+    """Semua posisi awal permutasi `pola` di `teks` (tidak peka huruf besar)."""
+    return list(_posisi_anagram([teks.lower()], pola.lower()))
+
+
+def cari_anagram_file(path: str, pola: str, ukuran_chunk: int = 1 << 24):
+    """
+    Versi untuk file teks sangat besar (multi-GB). File di-mmap lalu dibaca
+    per chunk; jendela yang melintasi batas chunk tetap ditangani karena
+    m byte terakhir setiap chunk dibawa ke chunk berikutnya.
+    Yield offset byte dari setiap kecocokan (pencocokan ASCII, tidak peka
+    huruf besar).
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            def potongan():
+                for awal in range(0, len(mm), ukuran_chunk):
+                    yield mm[awal:awal + ukuran_chunk].lower()
+            yield from _posisi_anagram(potongan(), pola.lower().encode())
+
+
 # ============================================================
 # SOAL 4 — FIRST RECURRING CHARACTER
 # Menemukan karakter pertama yang muncul lebih dari sekali
@@ -68,34 +168,661 @@ def karakter_berulang_pertama(teks: str):
     return None  # tidak ada karakter berulang
 
 
+def karakter_berulang_stream(records):
+    """
+    Versi streaming: yield karakter berulang pertama untuk setiap record
+    dari iterable `records` (mis. baris-baris file log).
+      - record str   → karakter atau None
+      - record bytes → nilai byte (int) atau -1
+    Tabel "terlihat" dipakai ulang antar record dengan cap nomor record,
+    sehingga tidak ada set baru yang dibuat per panggilan.
+    """
+    terlihat_byte = [0] * 256   # tabel tetap 256 slot untuk input bytes
+    terlihat_str = {}
+    cap = 0
+    for rec in records:
+        cap += 1
+        if isinstance(rec, str):
+            hasil = None
+            for huruf in rec:
+                if terlihat_str.get(huruf) == cap:
+                    hasil = huruf
+                    break
+                terlihat_str[huruf] = cap
+        else:
+            hasil = -1
+            for b in rec:
+                if terlihat_byte[b] == cap:
+                    hasil = b
+                    break
+                terlihat_byte[b] = cap
+        yield hasil
+
+
+def _berulang_buffer(buf, pemisah):
+    """Satu pass atas buffer bytes besar; record dipisah oleh byte `pemisah`."""
+    if len(pemisah) != 1:
+        raise ValueError("pemisah harus tepat satu byte")
+    sep = pemisah[0]
+    terlihat = [0] * 256
+    hasil = array('h')
+    cap = 1
+    selesai = False     # record sekarang sudah punya jawaban
+    kosong = True       # record sekarang belum berisi byte apa pun
+    for b in memoryview(buf).cast('B'):
+        if b == sep:
+            if not selesai:
+                hasil.append(-1)
+            cap += 1
+            selesai, kosong = False, True
+            continue
+        kosong = False
+        if selesai:
+            continue
+        if terlihat[b] == cap:
+            hasil.append(b)
+            selesai = True
+        else:
+            terlihat[b] = cap
+    # record terakhir tanpa pemisah penutup
+    if not kosong and not selesai:
+        hasil.append(-1)
+    return hasil
+
+
+def karakter_berulang_batch(data, pemisah: bytes = b"\n"):
+    """
+    Batch API untuk jutaan record sekaligus.
+      - list of str                → list berisi karakter / None
+      - bytes / bytearray / memoryview (record dipisah `pemisah`)
+                                   → array('h') berisi nilai byte / -1
+    Untuk input byte digunakan tabel 256 slot, bukan hash set.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return _berulang_buffer(data, pemisah)
+    return list(karakter_berulang_stream(data))
+
+
 # ============================================================
 # SOAL 5 — SIMULASI BUKU TELEPON
 # Program menu: tambah kontak, cari kontak, tampilkan semua
+#
+# Penyimpanan (jika `path` diberikan):
+#   path       → log append-only, satu baris per perubahan
+#                  "+\tnama\tnomor\n"  (tambah / ubah)
+#                  "-\tnama\n"         (hapus)
+#   path.dat   → hasil kompaksi: rekaman "kunci\tnama\tnomor\n" terurut
+#                menurut kunci, diikuti footer offset array('Q') (n+1
+#                entri) dan n. File ini cukup di-mmap saat start.
 # ============================================================
 
-class BukuTelepon:
+def _bersih(teks: str) -> str:
+    """Tab dan newline dipakai sebagai pemisah di file, jadi diganti spasi."""
+    return teks.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+
+
+class _DaftarKunci:
+    """Urutan kunci pada file data ber-mmap, agar bisa langsung di-bisect."""
+
+    def __init__(self, buku):
+        self.buku = buku
+
+    def __len__(self):
+        return self.buku._n_basis
+
+    def __getitem__(self, i):
+        return self.buku._kunci_basis(i)
+
+
+def _tabel_pola(pola: str) -> dict:
+    """Karakter → bitmask posisinya di `pola` (untuk _jarak_edit)."""
+    tabel = {}
+    for i, c in enumerate(pola):
+        tabel[c] = tabel.get(c, 0) | (1 << i)
+    return tabel
+
+
+def _jarak_edit(a: str, b: str, batas: int, tabel: dict = None) -> int:
+    """
+    Levenshtein dengan batas: hasil > batas → batas + 1.
+    Bit-parallel (Myers/Hyyrö): satu kolom DP untuk seluruh `a` diproses
+    sebagai beberapa operasi int per karakter `b`. `tabel` = _tabel_pola(a),
+    bisa dihitung sekali lalu dipakai ulang untuk banyak `b`.
+    """
+    if abs(len(a) - len(b)) > batas:
+        return batas + 1
+    m = len(a)
+    if m == 0:
+        return min(len(b), batas + 1)
+    if tabel is None:
+        tabel = _tabel_pola(a)
+    penuh = (1 << m) - 1
+    atas = 1 << (m - 1)
+    pv, mv, skor = penuh, 0, m
+    for c in b:
+        eq = tabel.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & penuh)
+        mh = pv & xh
+        if ph & atas:
+            skor += 1
+        elif mh & atas:
+            skor -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & penuh
+        mv = ph & xv
+    return min(skor, batas + 1)
+
+
+def _tanda_huruf(teks: str) -> int:
+    """
+    Bit (ord % 32) untuk tiap karakter; bit + 32 bila karakter muncul ≥ 2 kali.
+    Tiap bit yang ada di query tapi tidak di kunci butuh ≥ 1 operasi edit.
+    """
+    tanda = 0
+    for c in teks:
+        bit = 1 << (ord(c) & 31)
+        tanda |= (tanda & bit) << 32 | bit
+    return tanda
+
+
+def _hapus_satu(teks: str) -> set:
+    """Semua string hasil menghapus tepat satu karakter dari `teks`."""
+    return {teks[:i] + teks[i + 1:] for i in range(len(teks))}
+
+
+class _IndeksMirip:
+    """
+    Indeks pencarian mirip untuk jarak edit ≤ JARAK_INDEKS (2).
+
+    Kunci b dibelah dua: b1 = b[:L//2], b2 = sisanya. Jika ed(a, b) ≤ 2,
+    penjajaran optimal juga membelah query a = a1 + a2 dengan
+    ed(a1, b1) + ed(a2, b2) ≤ 2, jadi salah satu berlaku:
+      - a1 == b1 (a1 = a[:len(b1)]) atau a2 == b2 (a2 = a[-len(b2):]);
+      - ed(a1, b1) ≤ 1 dan ed(a2, b2) ≤ 1, dengan a1 prefix dan a2 suffix
+        dari a yang panjangnya selisih ≤ 1 dari belahan kunci.
+    Jarak ≤ 1 berarti ada string yang bisa dicapai dari keduanya dengan
+    ≤ 1 hapusan. Tiap belahan disimpan sebagai tingkat 0 (utuh, untuk U)
+    dan tingkat 1 (belahan itu sendiri + semua hapusan-satunya, deletion
+    neighbourhood gaya SymSpell, untuk B). Kandidat = (B1 ∩ B2) ∪ U1 ∪ U2,
+    lalu disaring tanda huruf sebelum jarak editnya dihitung.
+
+    Entri = hash (panjang kunci, belahan, tingkat, string) dan id. Bit
+    rendah hash memilih satu dari 2**EMBER_BIT ember; tiap ember menyimpan 32 bit
+    sisanya dan id dalam dua array('I') paralel yang terurut menurut hash,
+    jadi id satu entri bisa diambil sebagai slice. Tabrakan hash hanya
+    menambah kandidat yang nanti gugur di _jarak_edit.
+    """
+    JARAK_INDEKS = 2
+    EMBER_BIT = 12
+
     def __init__(self):
+        self.kunci = []              # id → kunci
+        self.id_kunci = {}           # kunci → id
+        self.tanda = array('Q')      # id → _tanda_huruf(kunci)
+        self.per_panjang = {}        # panjang kunci → array('I') berisi id
+        self.ember_hash = [array('I') for _ in range(1 << self.EMBER_BIT)]
+        self.ember_id = [array('I') for _ in range(1 << self.EMBER_BIT)]
+        self._terurut = True
+
+    @classmethod
+    def dari_kunci(cls, daftar_kunci):
+        """Bangun indeks sekaligus; tiap ember diurutkan sekali di akhir."""
+        indeks = cls()
+        indeks._terurut = False
+        for kunci in daftar_kunci:
+            indeks.tambah(kunci)
+        for b, hs in enumerate(indeks.ember_hash):
+            urutan = sorted(range(len(hs)), key=hs.__getitem__)
+            ids = indeks.ember_id[b]
+            indeks.ember_hash[b] = array('I', [hs[i] for i in urutan])
+            indeks.ember_id[b] = array('I', [ids[i] for i in urutan])
+        indeks._terurut = True
+        return indeks
+
+    @classmethod
+    def _hash(cls, panjang, belahan, tingkat, teks):
+        """(nomor ember, hash 32-bit di dalam ember)."""
+        h = hash((panjang, belahan, tingkat, teks))
+        return h & ((1 << cls.EMBER_BIT) - 1), (h >> cls.EMBER_BIT) & 0xFFFFFFFF
+
+    def tambah(self, kunci):
+        if kunci in self.id_kunci:
+            return
+        idx = len(self.kunci)
+        self.kunci.append(kunci)
+        self.id_kunci[kunci] = idx
+        self.tanda.append(_tanda_huruf(kunci))
+        panjang = len(kunci)
+        daftar = self.per_panjang.get(panjang)
+        if daftar is None:
+            daftar = self.per_panjang[panjang] = array('I')
+        daftar.append(idx)
+        tengah = panjang // 2
+        for belahan, teks in ((0, kunci[:tengah]), (1, kunci[tengah:])):
+            entri = [(0, teks), (1, teks)] + [(1, s) for s in _hapus_satu(teks)]
+            for tingkat, s in entri:
+                b, h = self._hash(panjang, belahan, tingkat, s)
+                hs = self.ember_hash[b]
+                i = bisect.bisect_right(hs, h) if self._terurut else len(hs)
+                hs.insert(i, h)
+                self.ember_id[b].insert(i, idx)
+
+    def _cari(self, panjang, belahan, tingkat, teks, hasil):
+        """Tambahkan ke `hasil` semua id dengan entri (panjang, belahan, tingkat, teks)."""
+        b, h = self._hash(panjang, belahan, tingkat, teks)
+        hs = self.ember_hash[b]
+        lo = bisect.bisect_left(hs, h)
+        hi = bisect.bisect_right(hs, h, lo)
+        hasil.update(self.ember_id[b][lo:hi])
+
+    def kandidat(self, query, jarak_maks):
+        """Yield kunci yang lolos filter panjang, indeks belahan, dan tanda huruf."""
+        lq = len(query)
+        ids = set()
+        if jarak_maks > self.JARAK_INDEKS:
+            # di luar jangkauan indeks: saring panjang saja
+            for panjang in range(max(0, lq - jarak_maks), lq + jarak_maks + 1):
+                ids.update(self.per_panjang.get(panjang, ()))
+        else:
+            for panjang in range(max(0, lq - jarak_maks), lq + jarak_maks + 1):
+                if panjang not in self.per_panjang:
+                    continue
+                tengah = panjang // 2
+                utuh, dekat = [], []
+                for belahan, ukuran in ((0, tengah), (1, panjang - tengah)):
+                    sama = set()
+                    if ukuran <= lq:
+                        teks = query[:ukuran] if belahan == 0 else query[lq - ukuran:]
+                        self._cari(panjang, belahan, 0, teks, sama)
+                    utuh.append(sama)
+                    # belahan query yang mungkin (panjang ± 1) beserta hapusannya;
+                    # entri tingkat 1 hanya sepanjang ukuran atau ukuran - 1
+                    varian = set()
+                    for n in range(max(0, ukuran - 1), min(lq, ukuran + 1) + 1):
+                        teks = query[:n] if belahan == 0 else query[lq - n:]
+                        if n <= ukuran:
+                            varian.add(teks)
+                        if n >= ukuran:
+                            varian |= _hapus_satu(teks)
+                    mirip = set()
+                    for teks in varian:
+                        self._cari(panjang, belahan, 1, teks, mirip)
+                    dekat.append(mirip)
+                ids |= utuh[0] | utuh[1] | (dekat[0] & dekat[1])
+        tanda_q = _tanda_huruf(query)
+        for idx in ids:
+            tanda = self.tanda[idx]
+            if (tanda_q & ~tanda).bit_count() > jarak_maks or (tanda & ~tanda_q).bit_count() > jarak_maks:
+                continue
+            yield self.kunci[idx]
+
+
+# Lokasi log buku telepon untuk menu interaktif (di samping script ini)
+BUKU_TELEPON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "buku_telepon.log")
+
+
+class BukuTelepon:
+    AMBANG_KOMPAKSI = 100_000   # jumlah baris log sebelum kompaksi otomatis
+
+    def __init__(self, path: str = None, ambang_kompaksi: int = AMBANG_KOMPAKSI):
+        self.path = path
+        self.ambang_kompaksi = ambang_kompaksi
+        self.kontak = {}          # perubahan sejak kompaksi: kunci → {"nama", "nomor"}
+        self._kunci_baru = []     # kunci self.kontak dalam urutan terurut
+        self._terhapus = set()    # kunci di file data yang sudah dihapus
+        self._jumlah = 0
+        self._baris_log = 0
+        self._indeks_mirip = None   # _IndeksMirip, dibangun saat pertama dipakai
+        self._log = None
+        self._mm = None
+        self._offset = array('Q')
+        self._n_basis = 0
+        self._daftar = _DaftarKunci(self)
+        if path is not None:
+            self._buka_basis()
+            self._putar_ulang_log()
+            self._log = open(path, 'a', encoding='utf-8', newline="\n")
+
+    # ---- File data (hasil kompaksi) ----
+
+    def _buka_basis(self):
+        dat = self.path + ".dat"
+        if not os.path.exists(dat) or os.path.getsize(dat) == 0:
+            return
+        with open(dat, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        ukuran = len(self._mm)
+        n = int.from_bytes(self._mm[ukuran - 8:], 'little')
+        awal_footer = ukuran - 8 - 8 * (n + 1)
+        self._offset = memoryview(self._mm)[awal_footer:ukuran - 8].cast('Q')
+        self._n_basis = n
+        self._jumlah = n
+
+    def _tutup_basis(self):
+        if isinstance(self._offset, memoryview):
+            self._offset.release()
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = None
+        self._offset = array('Q')
+        self._n_basis = 0
+
+    def _kunci_basis(self, i):
+        awal = self._offset[i]
+        return self._mm[awal:self._mm.find(b"\t", awal)]
+
+    def _rekaman_basis(self, i):
+        baris = self._mm[self._offset[i]:self._offset[i + 1] - 1].decode('utf-8')
+        kunci, nama, nomor = baris.split("\t")
+        return kunci, {"nama": nama, "nomor": nomor}
+
+    def _indeks_basis(self, kunci):
+        """Indeks rekaman `kunci` di file data, atau -1."""
+        if not self._n_basis:
+            return -1
+        kb = kunci.encode('utf-8')
+        i = bisect.bisect_left(self._daftar, kb)
+        if i < self._n_basis and self._kunci_basis(i) == kb:
+            return i
+        return -1
+
+    # ---- Log append-only ----
+
+    def _putar_ulang_log(self):
+        if not os.path.exists(self.path):
+            return
+        utuh = 0    # panjang byte bagian log yang barisnya lengkap
+        with open(self.path, 'rb') as f:
+            for baris in f:
+                if not baris.endswith(b"\n"):
+                    break       # baris terakhir terpotong (crash saat menulis)
+                utuh += len(baris)
+                bagian = baris[:-1].decode('utf-8').split("\t")
+                if bagian[0] == "+" and len(bagian) == 3:
+                    self._set(bagian[1], bagian[2])
+                elif bagian[0] == "-" and len(bagian) == 2:
+                    self._hapus(bagian[1].lower())
+                self._baris_log += 1
+        # Buang potongan baris agar rekaman berikutnya tidak menempel padanya
+        if utuh < os.path.getsize(self.path):
+            os.truncate(self.path, utuh)
+
+    def _tulis_log(self, baris):
+        if self._log is None:
+            return
+        self._log.write(baris)
+        self._log.flush()
+        self._baris_log += 1
+        if self._baris_log >= self.ambang_kompaksi:
+            self.kompaksi()
+
+    # ---- Operasi inti (tanpa I/O layar) ----
+
+    def _cari(self, kunci):
+        if kunci in self.kontak:
+            return self.kontak[kunci]
+        if kunci in self._terhapus:
+            return None
+        i = self._indeks_basis(kunci)
+        return self._rekaman_basis(i)[1] if i >= 0 else None
+
+    def _set(self, nama, nomor, urutkan=True):
+        """urutkan=False: kunci baru hanya di-append, pemanggil wajib sort()."""
+        kunci = nama.lower()
+        if kunci not in self.kontak:
+            if kunci in self._terhapus:
+                self._terhapus.discard(kunci)
+                self._jumlah += 1
+            elif self._indeks_basis(kunci) < 0:
+                self._jumlah += 1
+            if urutkan:
+                bisect.insort(self._kunci_baru, kunci)
+            else:
+                self._kunci_baru.append(kunci)
+            if self._indeks_mirip is not None:
+                self._indeks_mirip.tambah(kunci)
+        self.kontak[kunci] = {"nama": nama, "nomor": nomor}
+
+    def _hapus(self, kunci):
+        ada = False
+        if kunci in self.kontak:
+            del self.kontak[kunci]
+            del self._kunci_baru[bisect.bisect_left(self._kunci_baru, kunci)]
+            ada = True
+        if kunci not in self._terhapus and self._indeks_basis(kunci) >= 0:
+            self._terhapus.add(kunci)
+            ada = True
+        if ada:
+            self._jumlah -= 1
+        return ada
+
+    def _iter_terurut(self, awalan=""):
+        """Yield (kunci, data) terurut untuk semua kontak berawalan `awalan`."""
+        def dari_basis():
+            kb = awalan.encode('utf-8')
+            i = bisect.bisect_left(self._daftar, kb) if self._n_basis else 0
+            while i < self._n_basis:
+                if not self._kunci_basis(i).startswith(kb):
+                    break
+                kunci, data = self._rekaman_basis(i)
+                if kunci not in self.kontak and kunci not in self._terhapus:
+                    yield kunci, data
+                i += 1
+
+        def dari_log():
+            j = bisect.bisect_left(self._kunci_baru, awalan)
+            for kunci in self._kunci_baru[j:]:
+                if not kunci.startswith(awalan):
+                    break
+                yield kunci, self.kontak[kunci]
+
+        return heapq.merge(dari_basis(), dari_log(), key=lambda x: x[0])
+
+    def __len__(self):
+        return self._jumlah
+
+    # ---- Pencarian mirip (toleran typo) ----
+
+    def bangun_indeks_mirip(self):
+        """Bangun indeks pencarian mirip dari semua kontak saat ini."""
+        self._indeks_mirip = _IndeksMirip.dari_kunci(
+            kunci for kunci, _ in self._iter_terurut())
+
+    def cari_mirip(self, nama: str, jarak_maks: int = 2, k: int = 5) -> list:
+        """
+        Top-k kontak dengan jarak edit ≤ `jarak_maks` dari `nama`,
+        diurutkan menurut (jarak, nama). Kembalikan list (jarak, data).
+        Kunci yang sudah dihapus tetap ada di indeks dan disaring di sini.
+        Indeks dibangun saat pemanggilan pertama bila belum ada.
+        """
+        if self._indeks_mirip is None:
+            self.bangun_indeks_mirip()
+        query = nama.lower()
+        tabel = _tabel_pola(query)
+        cocok = []
+        for kunci in self._indeks_mirip.kandidat(query, jarak_maks):
+            jarak = _jarak_edit(query, kunci, jarak_maks, tabel)
+            if jarak <= jarak_maks and self._cari(kunci) is not None:
+                cocok.append((jarak, kunci))
+        return [(jarak, self._cari(kunci)) for jarak, kunci in heapq.nsmallest(k, cocok)]
+
+    # ---- Persistensi ----
+
+    def kompaksi(self):
+        """
+        Gabungkan file data lama + perubahan di log menjadi file data baru
+        yang terurut, lalu kosongkan log. File baru ditulis ke .tmp lalu
+        di-rename (atomic), jadi crash di tengah tidak merusak data lama.
+        """
+        if self.path is None:
+            return
+        dat = self.path + ".dat"
+        offset = array('Q')
+        posisi = 0
+        with open(dat + ".tmp", 'wb') as f:
+            for kunci, data in self._iter_terurut():
+                rekaman = f"{kunci}\t{data['nama']}\t{data['nomor']}\n".encode('utf-8')
+                offset.append(posisi)
+                f.write(rekaman)
+                posisi += len(rekaman)
+            offset.append(posisi)
+            f.write(offset.tobytes())
+            f.write((len(offset) - 1).to_bytes(8, 'little'))
+        self._tutup_basis()
+        os.replace(dat + ".tmp", dat)
+
+        self._log.close()
+        self._log = open(self.path, 'w', encoding='utf-8', newline="\n")
+        self._baris_log = 0
         self.kontak = {}
+        self._kunci_baru = []
+        self._terhapus = set()
+        self._buka_basis()
+
+    # ---- Impor / ekspor massal ----
+
+    @staticmethod
+    def _format_file(path, format):
+        format = (format or os.path.splitext(path)[1].lstrip(".")).lower()
+        if format not in ("csv", "jsonl"):
+            raise ValueError(f"Format tidak dikenal: {format}")
+        return format
+
+    @staticmethod
+    def _baca_rekaman(f, format):
+        """Yield (nama, nomor) dari file CSV (nama,nomor) atau JSONL."""
+        if format == "csv":
+            for i, baris in enumerate(csv.reader(f)):
+                if len(baris) < 2:
+                    continue
+                if i == 0 and [x.strip().lower() for x in baris[:2]] == ["nama", "nomor"]:
+                    continue
+                yield baris[0].strip(), baris[1].strip()
+        else:
+            for baris in f:
+                if baris.strip():
+                    data = json.loads(baris)
+                    yield str(data["nama"]).strip(), str(data["nomor"]).strip()
+
+    def impor(self, path: str, format: str = None, ukuran_batch: int = 10_000) -> int:
+        """
+        Muat kontak massal dari CSV/JSONL secara streaming, tanpa print per
+        baris. Log ditulis per batch, indeks terurut diperbarui sekali di
+        akhir, lalu kompaksi dijalankan bila log sudah melewati ambang.
+        Kembalikan jumlah baris yang dimuat.
+        """
+        format = self._format_file(path, format)
+        jumlah = 0
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                rekaman = self._baca_rekaman(f, format)
+                while True:
+                    batch = list(itertools.islice(rekaman, ukuran_batch))
+                    if not batch:
+                        break
+                    log = []
+                    for nama, nomor in batch:
+                        if not nama or not nomor:
+                            continue
+                        nama, nomor = _bersih(nama), _bersih(nomor)
+                        self._set(nama, nomor, urutkan=False)
+                        log.append(f"+\t{nama}\t{nomor}\n")
+                        jumlah += 1
+                    if self._log is not None:
+                        self._log.writelines(log)
+                        self._baris_log += len(log)
+        finally:
+            # Batch yang sudah masuk tetap dipakai walau file rusak di tengah,
+            # jadi daftar kunci harus terurut lagi apa pun yang terjadi
+            self._kunci_baru.sort()
+        if self._log is not None:
+            self._log.flush()
+            if self._baris_log >= self.ambang_kompaksi:
+                self.kompaksi()
+        return jumlah
+
+    def ekspor(self, path: str, format: str = None) -> int:
+        """Tulis semua kontak (terurut) ke CSV/JSONL secara streaming."""
+        format = self._format_file(path, format)
+        jumlah = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if format == "csv":
+                penulis = csv.writer(f)
+                penulis.writerow(["nama", "nomor"])
+                for _, data in self._iter_terurut():
+                    penulis.writerow([data["nama"], data["nomor"]])
+                    jumlah += 1
+            else:
+                for _, data in self._iter_terurut():
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+                    jumlah += 1
+        return jumlah
+
+    def tutup(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self._tutup_basis()
+
+    # ---- Operasi menu ----
 
     def tambah_kontak(self, nama: str, nomor: str):
-        self.kontak[nama.lower()] = {"nama": nama, "nomor": nomor}
+        nama, nomor = _bersih(nama), _bersih(nomor)
+        self._set(nama, nomor)
+        self._tulis_log(f"+\t{nama}\t{nomor}\n")
         print(f"  ✔ Kontak '{nama}' berhasil ditambahkan.")
 
+    def hapus_kontak(self, nama: str):
+        nama = _bersih(nama)
+        if self._hapus(nama.lower()):
+            self._tulis_log(f"-\t{nama}\n")
+            print(f"  ✔ Kontak '{nama}' dihapus.")
+        else:
+            print(f"  ✘ Kontak '{nama}' tidak ditemukan.")
+
     def cari_kontak(self, nama: str):
-        hasil = self.kontak.get(nama.lower())
+        hasil = self._cari(nama.lower())
         if hasil:
             print(f"  ✔ Ditemukan → {hasil['nama']} : {hasil['nomor']}")
         else:
             print(f"  ✘ Kontak '{nama}' tidak ditemukan.")
+            # Saran hanya jika indeks mirip sudah dibangun (menu 8), agar
+            # pencarian biasa tidak memicu pembangunan indeks yang lama
+            saran = self.cari_mirip(nama, k=3) if self._indeks_mirip is not None else []
+            if saran:
+                daftar = ", ".join(data['nama'] for _, data in saran)
+                print(f"    Mungkin maksud Anda: {daftar}")
+
+    def cari_awalan(self, awalan: str, batas: int = 10) -> list:
+        """Autocomplete: maksimal `batas` kontak yang namanya berawalan `awalan`."""
+        hasil = itertools.islice(self._iter_terurut(awalan.lower()), batas)
+        return [data for _, data in hasil]
+
+    def halaman_kontak(self, halaman: int = 1, per_halaman: int = 20) -> list:
+        """Kontak pada halaman ke-`halaman` (mulai 1), tanpa memformat semuanya."""
+        awal = (halaman - 1) * per_halaman
+        hasil = itertools.islice(self._iter_terurut(), awal, awal + per_halaman)
+        return [data for _, data in hasil]
 
-    def tampilkan_semua(self):
-        if not self.kontak:
+    def tampilkan_semua(self, halaman: int = None, per_halaman: int = 20):
+        """Tanpa `halaman` semua kontak dicetak; dengan `halaman` hanya satu halaman."""
+        if not len(self):
             print("  (Buku telepon masih kosong)")
+            return
+        if halaman is None:
+            awal, isi = 0, (data for _, data in self._iter_terurut())
         else:
-            print(f"  {'No.':<5} {'Nama':<20} {'Nomor'}")
-            print("  " + "-" * 40)
-            for i, data in enumerate(self.kontak.values(), 1):
-                print(f"  {i:<5} {data['nama']:<20} {data['nomor']}")
+            awal, isi = (halaman - 1) * per_halaman, self.halaman_kontak(halaman, per_halaman)
+        print(f"  {'No.':<5} {'Nama':<20} {'Nomor'}")
+        print("  " + "-" * 40)
+        for i, data in enumerate(isi, awal + 1):
+            print(f"  {i:<5} {data['nama']:<20} {data['nomor']}")
+        if halaman is not None:
+            total = -(-len(self) // per_halaman)
+            print(f"  (Halaman {halaman} dari {total})")
 
     def jalankan(self):
         while True:
@@ -105,7 +832,12 @@ class BukuTelepon:
             print("  ║  1. Tambah kontak        ║")
             print("  ║  2. Cari kontak          ║")
             print("  ║  3. Tampilkan semua      ║")
-            print("  ║  4. Kembali ke menu utama║")
+            print("  ║  4. Cari awalan          ║")
+            print("  ║  5. Hapus kontak         ║")
+            print("  ║  6. Impor CSV/JSONL      ║")
+            print("  ║  7. Ekspor CSV/JSONL     ║")
+            print("  ║  8. Cari mirip (typo)    ║")
+            print("  ║  9. Kembali ke menu utama║")
             print("  ╚══════════════════════════╝")
 
             pilihan = input("\n  Pilihan: ").strip()
@@ -123,15 +855,106 @@ class BukuTelepon:
                 self.cari_kontak(nama)
 
             elif pilihan == '3':
-                print()
-                self.tampilkan_semua()
+                halaman = 1
+                while True:
+                    print()
+                    self.tampilkan_semua(halaman)
+                    if halaman * 20 >= len(self):
+                        break
+                    if input("  Enter = halaman berikutnya, q = selesai: ").strip().lower() == 'q':
+                        break
+                    halaman += 1
 
             elif pilihan == '4':
+                awalan = input("  Awalan nama: ").strip()
+                hasil = self.cari_awalan(awalan)
+                if not hasil:
+                    print(f"  ✘ Tidak ada kontak berawalan '{awalan}'.")
+                for data in hasil:
+                    print(f"  → {data['nama']} : {data['nomor']}")
+
+            elif pilihan == '5':
+                nama = input("  Hapus nama: ").strip()
+                self.hapus_kontak(nama)
+
+            elif pilihan in ('6', '7'):
+                path = input("  Path file (.csv / .jsonl): ").strip()
+                try:
+                    if pilihan == '6':
+                        print(f"  ✔ {self.impor(path):,} kontak dimuat.")
+                    else:
+                        print(f"  ✔ {self.ekspor(path):,} kontak ditulis.")
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"  ✘ Gagal: {e}")
+
+            elif pilihan == '8':
+                nama = input("  Cari nama (boleh typo): ").strip()
+                if self._indeks_mirip is None:
+                    print("  … membangun indeks pencarian mirip")
+                    self.bangun_indeks_mirip()
+                hasil = self.cari_mirip(nama)
+                if not hasil:
+                    print(f"  ✘ Tidak ada kontak yang mirip '{nama}'.")
+                for jarak, data in hasil:
+                    print(f"  → {data['nama']} : {data['nomor']}  (jarak {jarak})")
+
+            elif pilihan == '9':
                 break
             else:
                 print("  ✘ Pilihan tidak valid.")
 
 
+def benchmark_mirip(n: int = 100_000, jumlah_query: int = 200, seed: int = 0):
+    """
+    Ukur waktu bangun indeks, memori indeks, dan latensi cari_mirip.
+    Jalankan: python "latihan soal.py" --bench-mirip [n]
+    """
+    rng = random.Random(seed)
+    # Nama realistis: nama depan (kadang saja) + nama belakang, tanpa nomor
+    # unik, jadi banyak nama pendek dan suku kata yang sama
+    suku = ["bu", "di", "an", "to", "sa", "ni", "wa", "ti", "ko", "ma", "ra", "yu",
+            "li", "ah", "mad", "ri", "na", "dewi", "sri", "hen", "dra", "put", "ra",
+            "eka", "gus", "har", "jo", "ko", "su", "lis", "ty", "wan", "nur", "ha"]
+
+    def kata(a, b):
+        return "".join(rng.choice(suku) for _ in range(rng.randint(a, b))).capitalize()
+
+    buku = BukuTelepon()
+    for i in range(n):
+        nama = kata(1, 3) if rng.random() < 0.3 else f"{kata(1, 3)} {kata(1, 3)}"
+        buku._set(nama, str(i))
+
+    mulai = time.perf_counter()
+    buku.bangun_indeks_mirip()
+    t_bangun = time.perf_counter() - mulai
+    # Memori diukur pada pembangunan kedua: tracemalloc memperlambat alokasi
+    buku._indeks_mirip = None
+    tracemalloc.start()
+    buku.bangun_indeks_mirip()
+    memori, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    kunci = buku._indeks_mirip.kunci
+    query = []
+    for _ in range(jumlah_query):
+        q = list(rng.choice(kunci))
+        q[rng.randrange(len(q))] = rng.choice("aiueo")     # satu typo
+        query.append("".join(q))
+    waktu = {"pendek": [], "panjang": []}
+    for q in query:
+        mulai = time.perf_counter()
+        buku.cari_mirip(q, jarak_maks=2, k=5)
+        waktu["pendek" if len(q) <= 6 else "panjang"].append(time.perf_counter() - mulai)
+
+    print(f"  Kontak           : {len(buku):,} nama unik dari {n:,}")
+    print(f"  Bangun indeks    : {t_bangun:.2f} s")
+    print(f"  Memori indeks    : {memori / 2**20:.1f} MiB")
+    for jenis, daftar in waktu.items():
+        if daftar:
+            rata = sum(daftar) / len(daftar) * 1000
+            print(f"  Latensi {jenis:<8} : {rata:.3f} ms / query ({len(daftar)} query)")
+
+
 # ============================================================
 #                      MENU UTAMA
 # ============================================================
@@ -189,6 +1012,9 @@ def demo_soal3():
         hasil = "✔ ANAGRAM" if cek_anagram(k1, k2) else "✘ BUKAN anagram"
         print(f"  '{k1}' & '{k2}' → {hasil}")
 
+    teks, pola = "cbaebabacd", "abc"
+    print(f"\n  Posisi anagram '{pola}' dalam '{teks}' → {cari_anagram(teks, pola)}")
+
     # Input dari user
     print()
     k1 = input("  Coba sendiri — Kata 1: ").strip()
@@ -210,6 +1036,10 @@ def demo_soal4():
         else:
             print(f"  '{teks}' → tidak ada karakter berulang")
 
+    log = b"abcdea\nxyz\nprogramming\n"
+    hasil_batch = [chr(b) if b >= 0 else None for b in karakter_berulang_batch(log)]
+    print(f"\n  Batch bytes {log!r} → {hasil_batch}")
+
     # Input dari user
     print()
     teks = input("  Coba sendiri — masukkan string: ").strip()
@@ -224,8 +1054,12 @@ def demo_soal5():
     print("\n" + "=" * 50)
     print("  SOAL 5 — SIMULASI BUKU TELEPON")
     print("=" * 50)
-    buku = BukuTelepon()
-    buku.jalankan()
+    buku = BukuTelepon(BUKU_TELEPON_PATH)
+    print(f"  Data disimpan di: {BUKU_TELEPON_PATH}")
+    try:
+        buku.jalankan()
+    finally:
+        buku.tutup()
 
 
 def menu_utama():
@@ -265,4 +1099,8 @@ def menu_utama():
 
 
 if __name__ == "__main__":
-    menu_utama()
\ No newline at end of file
+    if "--bench-mirip" in sys.argv:
+        argumen = sys.argv[sys.argv.index("--bench-mirip") + 1:]
+        benchmark_mirip(int(argumen[0]) if argumen else 100_000)
+    else:
+        menu_utama()
\ No newline at end of file
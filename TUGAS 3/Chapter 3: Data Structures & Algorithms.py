@@ -3,8 +3,25 @@ Praktikum — Chapter 3: Data Structures & Algorithms
 Soal 1, 2, 3, 4, dan 5
 """
 
+import heapq
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
 import time
 import random
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: API batch jatuh ke bisect
+    np = None
 
 # ============================================================
 # SOAL 1 — Modified Binary Search: countOccurrences
@@ -48,17 +65,245 @@ def countOccurrences(sortedList, target):
     return right - left + 1
 
 
+def countOccurrencesBatch(sortedArr, targets):
+    """
+    Versi batch countOccurrences: hitung kemunculan banyak target sekaligus.
+      - sortedArr berupa NumPy array / np.memmap → np.searchsorted vektor
+        (side='left' dan side='right'), hasil np.ndarray
+      - list biasa (input kecil) → bisect per target, hasil list
+    Target diurutkan dulu agar probe berurutan ramah cache, lalu hasilnya
+    dikembalikan ke urutan input.
+    """
+    if np is not None and isinstance(sortedArr, np.ndarray):
+        t = np.asarray(targets)
+        urutan = np.argsort(t, kind="stable")
+        t_urut = t[urutan]
+        kiri = np.searchsorted(sortedArr, t_urut, side="left")
+        kanan = np.searchsorted(sortedArr, t_urut, side="right")
+        hasil = np.empty(len(t), dtype=np.int64)
+        hasil[urutan] = kanan - kiri
+        return hasil
+    return [bisect_right(sortedArr, t) - bisect_left(sortedArr, t) for t in targets]
+
+
+def loadSortedArray(path, dtype="int64"):
+    """Buka file biner berisi sorted array sebagai np.memmap (read-only)."""
+    if np is None:
+        raise ImportError("loadSortedArray membutuhkan NumPy")
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+class CompressedSortedMultiset:
+    """
+    Sorted multiset terkompresi run-length: hanya menyimpan nilai unik dan
+    jumlah kumulatifnya, cocok untuk data dengan sedikit nilai unik dan
+    run duplikat yang sangat panjang.
+      values[i]     = nilai unik ke-i (terurut naik)
+      cumulative[i] = banyak elemen dengan nilai <= values[i]
+    count, rank, dan countRange berjalan O(log d), d = banyak nilai unik.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.cumulative = []
+
+    @classmethod
+    def fromSorted(cls, iterable):
+        """Bangun secara streaming dari iterable yang sudah terurut."""
+        ms = cls()
+        total = 0
+        for x in iterable:
+            if ms.values and x == ms.values[-1]:
+                total += 1
+                ms.cumulative[-1] = total
+                continue
+            if ms.values and x < ms.values[-1]:
+                raise ValueError(f"Input tidak terurut: {x!r} setelah {ms.values[-1]!r}")
+            total += 1
+            ms.values.append(x)
+            ms.cumulative.append(total)
+        return ms
+
+    @classmethod
+    def fromSortedFile(cls, path, parse=int):
+        """Bangun dari file teks terurut (satu nilai per baris) tanpa memuat semuanya."""
+        with open(path) as f:
+            return cls.fromSorted(parse(line) for line in f if line.strip())
+
+    def __len__(self):
+        return self.cumulative[-1] if self.cumulative else 0
+
+    def rank(self, x):
+        """Banyak elemen yang < x."""
+        i = bisect_left(self.values, x)
+        return self.cumulative[i - 1] if i > 0 else 0
+
+    def count(self, x):
+        """Banyak kemunculan x (padanan countOccurrences)."""
+        i = bisect_left(self.values, x)
+        if i == len(self.values) or self.values[i] != x:
+            return 0
+        return self.cumulative[i] - (self.cumulative[i - 1] if i > 0 else 0)
+
+    def countRange(self, lo, hi):
+        """Banyak elemen dengan lo <= nilai <= hi."""
+        if hi < lo:
+            return 0
+        j = bisect_right(self.values, hi)
+        atas = self.cumulative[j - 1] if j > 0 else 0
+        return atas - self.rank(lo)
+
+
+class EytzingerIndex:
+    """
+    Indeks pencarian statis: data terurut disusun ulang dalam urutan BFS
+    (layout Eytzinger) di NumPy array, tree[1] = akar, anak dari k adalah
+    2k dan 2k+1. Beberapa level teratas selalu berdekatan di memori (tetap
+    di cache), dan penurunan k = 2k + (tree[k] < x) tidak bercabang.
+    Versi batch menurunkan semua query bersamaan, satu level per langkah.
+    """
+
+    def __init__(self, sortedArr):
+        if np is None:
+            raise ImportError("EytzingerIndex membutuhkan NumPy")
+        data = np.asarray(sortedArr)
+        n = len(data)
+        # rank[k] = indeks di data terurut untuk posisi Eytzinger k;
+        # rank[0] = n dipakai untuk "tidak ada elemen >= x"
+        rank = np.empty(n + 1, dtype=np.int64)
+        rank[0] = n
+        stack, k, i = [], 1, 0
+        while stack or k <= n:          # in-order traversal pohon implisit
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            rank[k] = i
+            i += 1
+            k = 2 * k + 1
+        self.n = n
+        self.depth = n.bit_length()
+        self.rank = rank
+        self.tree = np.empty(n + 1, dtype=data.dtype)
+        self.tree[1:] = data[rank[1:]]
+        if n:
+            self.tree[0] = data[0]      # tidak pernah dibaca, hanya pengisi
+
+    def _bound(self, x, strict):
+        tree, n, k = self.tree, self.n, 1
+        while k <= n:
+            k = 2 * k + int(tree[k] < x if strict else tree[k] <= x)
+        k >>= ((~k) & (k + 1)).bit_length()
+        return int(self.rank[k])
+
+    def lowerBound(self, x):
+        """Indeks pertama dengan nilai >= x (setara bisect_left)."""
+        return self._bound(x, True)
+
+    def upperBound(self, x):
+        """Indeks pertama dengan nilai > x (setara bisect_right)."""
+        return self._bound(x, False)
+
+    def count(self, x):
+        return self.upperBound(x) - self.lowerBound(x)
+
+    def _boundBatch(self, xs, strict):
+        tree, n = self.tree, self.n
+        k = np.ones(len(xs), dtype=np.int64)
+        for _ in range(self.depth):
+            aktif = k <= n
+            nilai = tree[np.where(aktif, k, 0)]
+            turun = (nilai < xs) if strict else (nilai <= xs)
+            k = np.where(aktif, 2 * k + turun, k)
+        k //= ((~k) & (k + 1)) * 2
+        return self.rank[k]
+
+    def countBatch(self, targets):
+        """Versi vektor dari count untuk array target."""
+        xs = np.asarray(targets)
+        return self._boundBatch(xs, False) - self._boundBatch(xs, True)
+
+
+def benchmarkSearchLayouts(sizes=(10**6,), numQueries=10**4, seed=0):
+    """
+    Bandingkan countOccurrences (find_left/find_right), bisect, dan
+    EytzingerIndex (skalar & batch) pada array terurut acak.
+    Ukuran 10^9 butuh ±8 GB per array int64, jadi pilih sesuai RAM.
+    """
+    if np is None:
+        print("  (NumPy tidak tersedia — benchmark dilewati)")
+        return
+    rng = np.random.default_rng(seed)
+    print(f"{'Ukuran':>12} | {'countOcc (s)':>12} | {'bisect (s)':>10} | "
+          f"{'Eytz (s)':>9} | {'Eytz batch':>10} | {'searchsorted':>12}")
+    print("-" * 80)
+    for n in sizes:
+        data = np.sort(rng.integers(0, n, size=n))
+        targets = rng.integers(0, n, size=numQueries)
+        dataList, targetList = data.tolist(), targets.tolist()
+
+        start = time.perf_counter()
+        expected = [countOccurrences(dataList, t) for t in targetList]
+        t_classic = time.perf_counter() - start
+
+        start = time.perf_counter()
+        countOccurrencesBatch(dataList, targetList)
+        t_bisect = time.perf_counter() - start
+
+        index = EytzingerIndex(data)
+        start = time.perf_counter()
+        for t in targetList:
+            index.count(t)
+        t_eytz = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = index.countBatch(targets)
+        t_batch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        countOccurrencesBatch(data, targets)
+        t_np = time.perf_counter() - start
+
+        assert got.tolist() == expected
+        print(f"{n:>12,} | {t_classic:>12.4f} | {t_bisect:>10.4f} | "
+              f"{t_eytz:>9.4f} | {t_batch:>10.4f} | {t_np:>12.4f}")
+
+
 # ============================================================
 # SOAL 2 — Bubble Sort dengan Analisis Langkah
 # ============================================================
 
-def bubbleSort(arr):
+class SortStats:
+    """
+    Penampung counter instrumentasi yang bisa dibagi beberapa pemanggilan
+    sort (mis. semua sub-sort di dalam hybridSort).
+    """
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.passes = 0
+
+    def add(self, comparisons=0, swaps=0, passes=0):
+        self.comparisons += comparisons
+        self.swaps += swaps
+        self.passes += passes
+
+    def __repr__(self):
+        return (f"SortStats(comparisons={self.comparisons}, "
+                f"swaps={self.swaps}, passes={self.passes})")
+
+
+def bubbleSort(arr, onPass=None, stats=None, instrument=True):
     """
     Bubble Sort yang mengembalikan:
       (sorted_list, total_comparisons, total_swaps, passes_used)
     Fitur:
       - Early termination jika tidak ada swap dalam satu pass
-      - Cetak state array setelah setiap pass
+      - onPass(passes_used, data) dipanggil setelah setiap pass (opsional);
+        tidak ada print sama sekali secara default
+      - stats (SortStats) ikut ditambah jika diberikan
+      - instrument=False → loop tanpa counter, counter dikembalikan None
     """
     data = arr[:]
     n = len(data)
@@ -68,17 +313,28 @@ def bubbleSort(arr):
 
     for i in range(n - 1):
         swapped = False
-        for j in range(n - 1 - i):
-            total_comparisons += 1
-            if data[j] > data[j + 1]:
-                data[j], data[j + 1] = data[j + 1], data[j]
-                total_swaps += 1
-                swapped = True
+        if instrument:
+            for j in range(n - 1 - i):
+                total_comparisons += 1
+                if data[j] > data[j + 1]:
+                    data[j], data[j + 1] = data[j + 1], data[j]
+                    total_swaps += 1
+                    swapped = True
+        else:
+            for j in range(n - 1 - i):
+                if data[j] > data[j + 1]:
+                    data[j], data[j + 1] = data[j + 1], data[j]
+                    swapped = True
         passes_used += 1
-        print(f"  Pass {passes_used}: {data}")
+        if onPass is not None:
+            onPass(passes_used, data)
         if not swapped:
             break
 
+    if not instrument:
+        return (data, None, None, passes_used)
+    if stats is not None:
+        stats.add(total_comparisons, total_swaps, passes_used)
     return (data, total_comparisons, total_swaps, passes_used)
 
 
@@ -86,10 +342,19 @@ def bubbleSort(arr):
 # SOAL 3 — Hybrid Sort
 # ============================================================
 
-def insertionSort(arr):
+def insertionSort(arr, stats=None, instrument=True):
     """Insertion Sort — kembalikan (sorted_arr, comparisons, swaps)"""
     data = arr[:]
     comparisons = swaps = 0
+    if not instrument:
+        for i in range(1, len(data)):
+            key = data[i]
+            j = i - 1
+            while j >= 0 and data[j] > key:
+                data[j + 1] = data[j]
+                j -= 1
+            data[j + 1] = key
+        return data, None, None
     for i in range(1, len(data)):
         key = data[i]
         j = i - 1
@@ -102,10 +367,12 @@ def insertionSort(arr):
             else:
                 break
         data[j + 1] = key
+    if stats is not None:
+        stats.add(comparisons, swaps)
     return data, comparisons, swaps
 
 
-def selectionSort(arr):
+def selectionSort(arr, stats=None, instrument=True):
     """Selection Sort — kembalikan (sorted_arr, comparisons, swaps)"""
     data = arr[:]
     n = len(data)
@@ -113,37 +380,309 @@ def selectionSort(arr):
     for i in range(n):
         min_idx = i
         for j in range(i + 1, n):
-            comparisons += 1
             if data[j] < data[min_idx]:
                 min_idx = j
+        if instrument:
+            comparisons += n - 1 - i
         if min_idx != i:
             data[i], data[min_idx] = data[min_idx], data[i]
             swaps += 1
+    if not instrument:
+        return data, None, None
+    if stats is not None:
+        stats.add(comparisons, swaps)
     return data, comparisons, swaps
 
 
-def hybridSort(theSeq, threshold=10):
+HYBRID_PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "hybrid_profile.json")
+DEFAULT_HYBRID_THRESHOLD = 10
+
+
+def loadHybridProfile(path=HYBRID_PROFILE_PATH):
     """
-    Hybrid Sort:
-      - Jika panjang sub-array <= threshold → gunakan Insertion Sort
-      - Jika panjang sub-array >  threshold → gunakan Selection Sort
-    Kembalikan (sorted_list, total_comparisons, total_swaps)
+    Baca profil {distribusi: threshold}; kosong jika file belum ada/rusak.
+    Threshold < 1 tidak masuk akal dan diabaikan.
     """
-    arr = theSeq[:]
+    try:
+        with open(path) as f:
+            profil = {k: int(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+    return {k: v for k, v in profil.items() if v >= 1}
+
+
+hybridProfile = loadHybridProfile()
+
+
+def hybridSort(theSeq, threshold=None, stats=None, instrument=True, distribution=None):
+    """
+    Hybrid Sort (merge sort + insertion sort):
+      - Sub-array dengan panjang <= threshold → Insertion Sort
+      - Sub-array lebih panjang → dibelah dua secara rekursif lalu di-merge
+    Kembalikan (sorted_list, total_comparisons, total_swaps).
+    Pada tahap merge, "swap" = elemen kanan yang dipindah mendahului
+    elemen kiri yang belum terpakai.
+    threshold=None → ambil dari hybridProfile (per `distribution`, lalu
+    "default"), jika tidak ada pakai DEFAULT_HYBRID_THRESHOLD.
+    """
+    if threshold is None:
+        threshold = hybridProfile.get(distribution,
+                                      hybridProfile.get("default", DEFAULT_HYBRID_THRESHOLD))
+    data = theSeq[:]
     total_comparisons = total_swaps = 0
+    threshold = max(threshold, 1)
 
-    def _sort(sub):
+    def _sort(lo, hi):
         nonlocal total_comparisons, total_swaps
-        if len(sub) <= threshold:
-            sorted_sub, c, s = insertionSort(sub)
-        else:
-            sorted_sub, c, s = selectionSort(sub)
-        total_comparisons += c
-        total_swaps += s
-        return sorted_sub
+        if hi - lo <= threshold:
+            data[lo:hi], c, s = insertionSort(data[lo:hi], instrument=instrument)
+            if instrument:
+                total_comparisons += c
+                total_swaps += s
+            return
+        mid = (lo + hi) // 2
+        _sort(lo, mid)
+        _sort(mid, hi)
+        if instrument:
+            total_comparisons += 1      # cek batas di bawah selalu dihitung
+        if not data[mid - 1] > data[mid]:
+            return                      # dua bagian sudah berurutan
+        left = data[lo:mid]
+        i, j, k = 0, mid, lo
+        nl = len(left)
+        while i < nl and j < hi:
+            if instrument:
+                total_comparisons += 1
+            if left[i] <= data[j]:
+                data[k] = left[i]; i += 1
+            else:
+                data[k] = data[j]; j += 1
+                if instrument:
+                    total_swaps += 1
+            k += 1
+        data[k:k + nl - i] = left[i:]   # sisa kiri; sisa kanan sudah di tempat
+
+    _sort(0, len(data))
+    if not instrument:
+        return data, None, None
+    if stats is not None:
+        stats.add(total_comparisons, total_swaps)
+    return data, total_comparisons, total_swaps
 
-    result = _sort(arr)
-    return result, total_comparisons, total_swaps
+
+def tuneHybridThreshold(n=5000, candidates=(4, 8, 12, 16, 24, 32, 48, 64),
+                        repeats=3, seed=0):
+    """
+    Pilih threshold hybridSort tercepat di mesin ini (waktu terbaik dari
+    `repeats` percobaan, tanpa instrumentasi) pada data acak berukuran n.
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(0, n) for _ in range(n)]
+    best, best_time = None, float("inf")
+    for threshold in candidates:
+        t = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            hybridSort(data, threshold, instrument=False)
+            t = min(t, time.perf_counter() - start)
+        if t < best_time:
+            best, best_time = threshold, t
+    return best
+
+
+MIN_GALLOP = 7
+
+
+def adaptiveSort(arr, stats=None):
+    """
+    Natural merge sort ala Timsort untuk input yang hampir terurut:
+      1. Deteksi run naik (non-decreasing) dan run turun tegas (dibalik).
+      2. Merge run bertetangga per level → O(n + n log r), r = banyak run.
+      3. Merge memakai galloping: setelah satu sisi menang MIN_GALLOP kali
+         berturut-turut, posisi berikutnya dicari dengan exponential search
+         lalu disalin sekaligus.
+    Kembalikan (sorted_list, comparisons, swaps). "Swap" dihitung seperti
+    insertionSort: banyak elemen yang dilompati ke kiri (= jumlah inversi).
+    Stabil.
+    """
+    data = arr[:]
+    n = len(data)
+    comparisons = swaps = 0
+
+    def gallop(key, a, lo, hi, after):
+        """Indeks pertama di a[lo:hi] dengan a[i] > key (after) / a[i] >= key."""
+        nonlocal comparisons
+        found_lo, ofs, probe = lo, 1, lo
+        while probe < hi:
+            comparisons += 1
+            if (a[probe] > key) if after else not (a[probe] < key):
+                break
+            found_lo = probe + 1
+            probe = lo + ofs
+            ofs = ofs * 2 + 1
+        found_hi = min(probe, hi)
+        while found_lo < found_hi:
+            mid = (found_lo + found_hi) // 2
+            comparisons += 1
+            if (a[mid] > key) if after else not (a[mid] < key):
+                found_hi = mid
+            else:
+                found_lo = mid + 1
+        return found_lo
+
+    def merge(lo, mid, hi):
+        nonlocal comparisons, swaps
+        # elemen kiri yang <= awal kanan, dan elemen kanan yang >= akhir
+        # kiri, sudah berada di posisi akhirnya
+        start = gallop(data[mid], data, lo, mid, True)
+        if start == mid:
+            return
+        end = gallop(data[mid - 1], data, mid, hi, False)
+        left = data[start:mid]
+        nl = len(left)
+        i, j, k = 0, mid, start
+        winsL = winsR = 0
+        while i < nl and j < end:
+            comparisons += 1
+            if data[j] < left[i]:
+                data[k] = data[j]; k += 1; j += 1
+                swaps += nl - i
+                winsR += 1; winsL = 0
+                if winsR >= MIN_GALLOP:
+                    e = gallop(left[i], data, j, end, False)
+                    data[k:k + e - j] = data[j:e]
+                    swaps += (e - j) * (nl - i)
+                    k += e - j; j = e
+                    winsR = 0
+            else:
+                data[k] = left[i]; k += 1; i += 1
+                winsL += 1; winsR = 0
+                if winsL >= MIN_GALLOP and j < end:
+                    e = gallop(data[j], left, i, nl, True)
+                    data[k:k + e - i] = left[i:e]
+                    k += e - i; i = e
+                    winsL = 0
+        data[k:k + nl - i] = left[i:]   # sisa kanan sudah di tempat
+
+    # 1. Deteksi run
+    bounds = [0]
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n:
+            comparisons += 1
+            if data[j] < data[j - 1]:
+                j += 1
+                while j < n:
+                    comparisons += 1
+                    if not data[j] < data[j - 1]:
+                        break
+                    j += 1
+                data[i:j] = data[i:j][::-1]
+                swaps += (j - i) * (j - i - 1) // 2
+            else:
+                j += 1
+                while j < n:
+                    comparisons += 1
+                    if data[j] < data[j - 1]:
+                        break
+                    j += 1
+        bounds.append(j)
+        i = j
+
+    # 2. Merge run bertetangga, level demi level
+    while len(bounds) > 2:
+        merged = [0]
+        runs = len(bounds) - 1
+        for r in range(0, runs - 1, 2):
+            merge(bounds[r], bounds[r + 1], bounds[r + 2])
+            merged.append(bounds[r + 2])
+        if runs % 2:
+            merged.append(bounds[-1])
+        bounds = merged
+
+    if stats is not None:
+        stats.add(comparisons, swaps)
+    return data, comparisons, swaps
+
+
+def makeDistribution(name, n, rng):
+    """Data uji: random, sorted, reversed, few-unique, nearly-sorted."""
+    if name == "random":
+        return [rng.randint(0, n) for _ in range(n)]
+    if name == "sorted":
+        return list(range(n))
+    if name == "reversed":
+        return list(range(n, 0, -1))
+    if name == "few-unique":
+        return [rng.randint(0, 9) for _ in range(n)]
+    if name == "nearly-sorted":
+        data = list(range(n))
+        for _ in range(max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        return data
+    raise ValueError(f"Distribusi tidak dikenal: {name}")
+
+
+HYBRID_DISTRIBUTIONS = ("random", "sorted", "reversed", "few-unique", "nearly-sorted")
+
+
+def benchmarkHybridThresholds(sizes=(1000, 5000), thresholds=(4, 8, 16, 24, 32, 64),
+                              distributions=HYBRID_DISTRIBUTIONS, repeats=3,
+                              save=False, path=HYBRID_PROFILE_PATH, seed=0):
+    """
+    Sapu threshold hybridSort untuk tiap ukuran & distribusi; catat wall
+    time (terbaik dari `repeats`), comparisons, dan swaps. Threshold dengan
+    total waktu terkecil (dijumlah atas semua ukuran) jadi yang terbaik per
+    distribusi. save=True → tulis profil ke `path` dan langsung dipakai
+    hybridSort; "default" = terbaik untuk distribusi random.
+    """
+    rng = random.Random(seed)
+    best = {}
+    print(f"{'Distribusi':>13} | {'n':>6} | {'thr':>4} | {'Waktu (s)':>9} | "
+          f"{'Comparisons':>11} | {'Swaps':>9}")
+    print("-" * 68)
+    for dist in distributions:
+        totals = dict.fromkeys(thresholds, 0.0)
+        for n in sizes:
+            data = makeDistribution(dist, n, rng)
+            for thr in thresholds:
+                t = float("inf")
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    hybridSort(data, thr, instrument=False)
+                    t = min(t, time.perf_counter() - start)
+                _, c, sw = hybridSort(data, thr)
+                totals[thr] += t
+                print(f"{dist:>13} | {n:>6} | {thr:>4} | {t:>9.4f} | {c:>11,} | {sw:>9,}")
+        best[dist] = min(totals, key=totals.get)
+    if "random" in best:
+        best["default"] = best["random"]
+    print(f"Threshold terbaik: {best}")
+    if save:
+        with open(path, "w") as f:
+            json.dump(best, f, indent=2)
+        hybridProfile.clear()
+        hybridProfile.update(best)
+    return best
+
+
+def benchmarkInstrumentation(n=2000, seed=0):
+    """Ukur overhead counter: waktu tiap sort dengan instrument=True vs False."""
+    rng = random.Random(seed)
+    data = [rng.randint(0, n) for _ in range(n)]
+    print(f"{'Sort':>10} | {'Instrumented (s)':>16} | {'Polos (s)':>10} | {'Overhead':>8}")
+    print("-" * 54)
+    for nama, fungsi in [("bubble", bubbleSort), ("insertion", insertionSort),
+                         ("selection", selectionSort), ("hybrid", hybridSort)]:
+        start = time.perf_counter(); fungsi(data, instrument=True)
+        t_on = time.perf_counter() - start
+        start = time.perf_counter(); fungsi(data, instrument=False)
+        t_off = time.perf_counter() - start
+        overhead = (t_on / t_off - 1) * 100 if t_off > 0 else 0.0
+        print(f"{nama:>10} | {t_on:>16.4f} | {t_off:>10.4f} | {overhead:>7.1f}%")
 
 
 # ============================================================
@@ -191,6 +730,279 @@ def mergeThreeSortedLists(listA, listB, listC):
     return result
 
 
+def mergeKSorted(iterables, key=None):
+    """
+    Generalisasi mergeThreeSortedLists untuk k sumber terurut sekaligus.
+    Sumber boleh berupa iterator apa saja (generator, pembaca file, ...);
+    hasil di-yield secara lazy dengan binary heap berisi satu elemen per
+    sumber → memori O(k), waktu O(n log k). Stabil: nilai yang sama keluar
+    menurut urutan sumbernya.
+    """
+    heap = []
+    for idx, it in enumerate(iterables):
+        it = iter(it)
+        for first in it:
+            heap.append((first if key is None else key(first), idx, first, it))
+            break
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        _, idx, item, it = heap[0]
+        yield item
+        for nxt in it:
+            heapq.heapreplace(heap, (nxt if key is None else key(nxt), idx, nxt, it))
+            break
+        else:
+            heapq.heappop(heap)
+    if heap:                            # sisa satu sumber: salin langsung
+        _, _, item, it = heap[0]
+        yield item
+        yield from it
+
+
+def _mergeTwoSortedLists(listA, listB):
+    result = []
+    i = j = 0
+    while i < len(listA) and j < len(listB):
+        if listA[i] <= listB[j]:
+            result.append(listA[i]); i += 1
+        else:
+            result.append(listB[j]); j += 1
+    result.extend(listA[i:])
+    result.extend(listB[j:])
+    return result
+
+
+def benchmarkKWayMerge(k=200, perList=500, seed=0):
+    """Bandingkan mergeKSorted dengan merge berpasangan berulang (kiri ke kanan)."""
+    rng = random.Random(seed)
+    shards = [sorted(rng.randint(0, 10**6) for _ in range(perList)) for _ in range(k)]
+
+    start = time.perf_counter()
+    merged = []
+    for shard in shards:
+        merged = _mergeTwoSortedLists(merged, shard)
+    t_pairwise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    heap_merged = list(mergeKSorted(shards))
+    t_heap = time.perf_counter() - start
+
+    assert heap_merged == merged
+    print(f"  k={k}, {k * perList:,} elemen: pairwise {t_pairwise:.4f} s | "
+          f"heap k-way {t_heap:.4f} s | speedup {t_pairwise / t_heap:.1f}x")
+
+
+def _readRun(path, typecode, bufferItems, stats):
+    """Baca file run biner secara berblok; yield elemen satu per satu."""
+    block = array(typecode, [0]) * bufferItems    # satu blok dipakai ulang
+    with open(path, "rb") as f, memoryview(block) as view:
+        while True:
+            count = f.readinto(view.cast("B")) // block.itemsize
+            if not count:
+                return
+            stats["bytesRead"] += count * block.itemsize
+            yield from view[:count]
+
+
+def _writeRun(path, items, typecode, bufferItems, stats):
+    """Tulis elemen ke file run biner dengan buffer berukuran bufferItems."""
+    block = array(typecode, [0]) * bufferItems
+    count = 0
+    with open(path, "wb") as f, memoryview(block) as view:
+        for x in items:
+            block[count] = x
+            count += 1
+            if count == bufferItems:
+                f.write(view)
+                count = 0
+                stats["bytesWritten"] += bufferItems * block.itemsize
+        f.write(view[:count])
+        stats["bytesWritten"] += count * block.itemsize
+
+
+def externalSort(inputPath, outputPath, memoryLimit=64 * 2**20, fanIn=8,
+                 typecode="q", tmpDir=None):
+    """
+    External merge sort untuk data yang tidak muat di RAM.
+    Input/output: file biner berisi array(typecode) (default int64).
+      1. Baca chunk yang muat di memoryLimit, urutkan, tulis sebagai run
+         biner. Dengan NumPy chunk diurutkan di tempat lewat view
+         frombuffer (biaya = itemsize per elemen); tanpa NumPy sorted()
+         membuat objek Python per elemen, jadi chunk diperkecil sesuai
+         biaya itu.
+      2. Merge k-way (k = fanIn, perluasan mergeThreeSortedLists lewat
+         mergeKSorted) berulang sampai tersisa satu run; tiap sumber dan
+         output dibaca/ditulis per blok sehingga total buffer ≈ memoryLimit.
+    Kembalikan statistik: runs awal, merge passes, byte dibaca & ditulis.
+    """
+    if fanIn < 2:
+        raise ValueError("fanIn minimal 2")
+    itemsize = array(typecode).itemsize
+    if np is not None:
+        perItem = itemsize
+    else:
+        # buffer chunk + array hasil + slot list + objek int/float per elemen
+        contoh = 0.0 if typecode in "fd" else 2**62
+        perItem = 2 * itemsize + 8 + sys.getsizeof(contoh)
+    chunkItems = max(1, memoryLimit // perItem)
+    bufferItems = max(1, memoryLimit // (itemsize * (fanIn + 1)))
+    stats = {"runs": 0, "passes": 0, "bytesRead": 0, "bytesWritten": 0}
+    workDir = tempfile.mkdtemp(prefix="extsort_", dir=tmpDir)
+    counter = 0
+
+    def newRunPath():
+        nonlocal counter
+        counter += 1
+        return os.path.join(workDir, f"run_{counter:06d}.bin")
+
+    try:
+        # 1. Pembentukan run; satu buffer chunk dipakai ulang dan diisi
+        #    langsung dengan readinto (tanpa salinan bytes sementara)
+        runs = []
+        chunk = array(typecode, [0]) * chunkItems
+        view = memoryview(chunk)
+        with open(inputPath, "rb") as f:
+            while True:
+                count = f.readinto(view.cast("B")) // itemsize
+                if not count:
+                    break
+                stats["bytesRead"] += count * itemsize
+                path = newRunPath()
+                with open(path, "wb") as out:
+                    if np is not None:
+                        np.frombuffer(chunk, dtype=np.dtype(typecode), count=count).sort()
+                        out.write(view[:count])
+                    else:
+                        array(typecode, sorted(view[:count])).tofile(out)
+                stats["bytesWritten"] += count * itemsize
+                runs.append(path)
+        view.release()
+        del chunk, view     # buffer merge di bawah memakai budget yang sama
+        stats["runs"] = len(runs)
+
+        # 2. Merge multi-pass, fanIn run sekaligus
+        while len(runs) > 1:
+            nextRuns = []
+            for g in range(0, len(runs), fanIn):
+                group = runs[g:g + fanIn]
+                if len(group) == 1:
+                    nextRuns.append(group[0])
+                    continue
+                path = newRunPath()
+                sources = [_readRun(r, typecode, bufferItems, stats) for r in group]
+                _writeRun(path, mergeKSorted(sources), typecode, bufferItems, stats)
+                for r in group:
+                    os.remove(r)
+                nextRuns.append(path)
+            runs = nextRuns
+            stats["passes"] += 1
+
+        if runs:
+            shutil.move(runs[0], outputPath)
+        else:
+            open(outputPath, "wb").close()
+    finally:
+        shutil.rmtree(workDir, ignore_errors=True)
+    return stats
+
+
+def _mergePathSplit(arrays, t):
+    """
+    Titik potong merge-path untuk k array terurut: banyak elemen yang
+    diambil dari tiap array agar t elemen pertama hasil merge (stabil,
+    nilai sama → array berindeks kecil dulu) persis terpenuhi.
+    """
+    lengths = [len(a) for a in arrays]
+    if t <= 0:
+        return [0] * len(arrays)
+    if t >= sum(lengths):
+        return lengths
+
+    def before(i, e):
+        # banyak elemen dari array lain yang keluar sebelum e milik array i
+        return [int(np.searchsorted(a, e, side="right" if l < i else "left"))
+                if l != i else None for l, a in enumerate(arrays)]
+
+    # cari elemen yang menempati posisi global ke-t (0-based)
+    for i, a in enumerate(arrays):
+        lo, hi = 0, len(a)
+        while lo < hi:
+            j = (lo + hi) // 2
+            counts = before(i, a[j])
+            rank = j + sum(c for c in counts if c is not None)
+            if rank < t:
+                lo = j + 1
+            elif rank > t:
+                hi = j
+            else:
+                counts[i] = j
+                return counts
+    raise AssertionError("posisi merge-path tidak ditemukan")
+
+
+def _parallelMergeWorker(task):
+    inName, outName, dtype, offsets, starts, ends, outStart = task
+    shmIn = shared_memory.SharedMemory(name=inName)
+    shmOut = shared_memory.SharedMemory(name=outName)
+    try:
+        src = np.ndarray((offsets[-1],), dtype=dtype, buffer=shmIn.buf)
+        dst = np.ndarray((offsets[-1],), dtype=dtype, buffer=shmOut.buf)
+        pieces = [src[offsets[l] + starts[l]:offsets[l] + ends[l]]
+                  for l in range(len(starts))]
+        # potongan sudah berurutan sesuai indeks array → stable sort = merge stabil
+        merged = np.sort(np.concatenate(pieces), kind="stable")
+        dst[outStart:outStart + len(merged)] = merged
+        del src, dst, pieces, merged
+    finally:
+        shmIn.close()
+        shmOut.close()
+
+
+def parallelMergeSorted(lists, workers=None):
+    """
+    Merge k sorted list/array secara paralel. Output dibagi menjadi
+    `workers` rentang sama besar; titik potong tiap rentang di semua input
+    dicari dengan binary search (merge-path partitioning), lalu tiap
+    rentang di-merge oleh proses terpisah di atas shared-memory NumPy
+    buffer. Hasil identik dengan merge sekuensial (mergeKSorted).
+    """
+    if np is None:
+        raise ImportError("parallelMergeSorted membutuhkan NumPy")
+    arrays = [np.asarray(a) for a in lists]
+    dtype = np.result_type(*arrays) if arrays else np.dtype(np.int64)
+    total = sum(len(a) for a in arrays)
+    if total == 0:
+        return np.empty(0, dtype=dtype)
+    parts = max(1, min(workers or os.cpu_count() or 1, total))
+    bounds = [_mergePathSplit(arrays, total * r // parts) for r in range(parts + 1)]
+
+    offsets = [0]
+    for a in arrays:
+        offsets.append(offsets[-1] + len(a))
+    nbytes = total * dtype.itemsize
+    shmIn = shared_memory.SharedMemory(create=True, size=nbytes)
+    shmOut = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        src = np.ndarray((total,), dtype=dtype, buffer=shmIn.buf)
+        for l, a in enumerate(arrays):
+            src[offsets[l]:offsets[l + 1]] = a
+        del src
+        tasks = [(shmIn.name, shmOut.name, dtype.str, offsets, bounds[r], bounds[r + 1],
+                  total * r // parts) for r in range(parts)]
+        # "fork" (POSIX) agar proses anak tidak menjalankan ulang demo modul ini
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(parts, mp_context=multiprocessing.get_context(method)) as pool:
+            list(pool.map(_parallelMergeWorker, tasks))
+        dst = np.ndarray((total,), dtype=dtype, buffer=shmOut.buf)
+        result = dst.copy()
+        del dst
+        return result
+    finally:
+        shmIn.close(); shmIn.unlink()
+        shmOut.close(); shmOut.unlink()
+
+
 # ============================================================
 # SOAL 5 — Inversions Counter
 # ============================================================
@@ -231,6 +1043,299 @@ def countInversionsSmart(arr):
     return total
 
 
+def _inversionBuffer(arr):
+    """
+    ndarray numerik jika NumPy tersedia; tanpa NumPy array('q') (8 byte per
+    elemen) jika semua elemen int 64-bit, selain itu list.
+    """
+    if np is not None:
+        a = np.asarray(arr)
+        if a.ndim == 1 and a.dtype.kind in "biuf":
+            return a
+    try:
+        return array("q", arr)
+    except (TypeError, OverflowError):
+        return list(arr)
+
+
+def _mergeCountBottomUp(src):
+    """
+    Merge sort bottom-up di atas buffer `src` dengan satu buffer bantu;
+    peran src/dst ditukar (ping-pong) setiap lebar run digandakan.
+    Kembalikan (buffer_terurut, inversi).
+    """
+    n = len(src)
+    dst = src[:]
+    total = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[i] <= src[j]:
+                    dst[k] = src[i]; i += 1
+                else:
+                    dst[k] = src[j]; j += 1
+                    total += mid - i
+                k += 1
+            while i < mid:
+                dst[k] = src[i]; i += 1; k += 1
+            while j < hi:
+                dst[k] = src[j]; j += 1; k += 1
+        src, dst = dst, src
+        width *= 2
+    return src, total
+
+
+def _mergeCount(buf):
+    """
+    (buffer_terurut, inversi): level pass NumPy (_mergeCountNumpy) untuk
+    ndarray, loop Python (_mergeCountBottomUp) untuk buffer lainnya.
+    """
+    if np is not None and isinstance(buf, np.ndarray):
+        return _mergeCountNumpy(buf)
+    return _mergeCountBottomUp(buf)
+
+
+def countInversionsBottomUp(arr):
+    """
+    O(n log n) tanpa rekursi dan tanpa slicing per level: merge-count
+    bottom-up, divektorkan dengan NumPy bila tersedia; tanpa NumPy pakai
+    buffer ping-pong array('q') (fallback list untuk elemen non-integer).
+    """
+    return _mergeCount(_inversionBuffer(arr))[1]
+
+
+def _sortCountChunk(chunk):
+    return _mergeCount(chunk)
+
+
+def _mergeCountPair(pair):
+    """Merge dua chunk terurut; hitung inversi lintas chunk (kiri > kanan)."""
+    left, right = pair
+    if np is not None and isinstance(left, np.ndarray):
+        # tiap elemen kanan dilompati oleh semua elemen kiri yang > dirinya
+        cross = int((len(left) - np.searchsorted(left, right, side="right")).sum())
+        merged = np.concatenate((left, right))
+        merged.sort(kind="stable")
+        return merged, cross
+    merged = left[:0]
+    cross = 0
+    i = j = 0
+    nl, nr = len(left), len(right)
+    while i < nl and j < nr:
+        if left[i] <= right[j]:
+            merged.append(left[i]); i += 1
+        else:
+            merged.append(right[j]); j += 1
+            cross += nl - i
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged, cross
+
+
+def countInversionsParallel(arr, workers=None, chunks=None):
+    """
+    Mode paralel berbasis chunk: tiap worker menghitung inversi di dalam
+    chunknya sendiri sambil mengurutkannya, lalu chunk bertetangga
+    digabung berpasangan (juga di worker) sambil menghitung inversi lintas
+    chunk, sampai tersisa satu. Total = jumlah semua hitungan.
+    """
+    buf = _inversionBuffer(arr)
+    n = len(buf)
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(chunks or workers, n))
+    if chunks == 1:
+        return _mergeCount(buf)[1]
+    bounds = [n * c // chunks for c in range(chunks + 1)]
+    parts = [buf[bounds[c]:bounds[c + 1]] for c in range(chunks)]
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    total = 0
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method)) as pool:
+        results = list(pool.map(_sortCountChunk, parts))
+        total += sum(c for _, c in results)
+        sortedParts = [p for p, _ in results]
+        while len(sortedParts) > 1:
+            pairs = [(sortedParts[i], sortedParts[i + 1])
+                     for i in range(0, len(sortedParts) - 1, 2)]
+            merged = list(pool.map(_mergeCountPair, pairs))
+            total += sum(c for _, c in merged)
+            nextParts = [p for p, _ in merged]
+            if len(sortedParts) % 2:
+                nextParts.append(sortedParts[-1])
+            sortedParts = nextParts
+    return total
+
+
+def countInversionsFenwick(arr):
+    """
+    O(n log n) dengan Fenwick tree (Binary Indexed Tree) + kompresi
+    koordinat: untuk tiap elemen, hitung berapa elemen sebelumnya yang
+    lebih besar = i - (banyak elemen sebelumnya yang <= nilai ini).
+    """
+    ranks = {v: r for r, v in enumerate(sorted(set(arr)), 1)}
+    m = len(ranks)
+    tree = [0] * (m + 1)
+    total = 0
+    for i, x in enumerate(arr):
+        r = ranks[x]
+        seen = 0                        # prefix sum: elemen terdahulu <= x
+        k = r
+        while k > 0:
+            seen += tree[k]
+            k -= k & -k
+        total += i - seen
+        k = r
+        while k <= m:
+            tree[k] += 1
+            k += k & -k
+    return total
+
+
+def countInversionsNumpy(arr):
+    """
+    Merge-count bottom-up yang divektorkan dengan NumPy. Di tiap level,
+    semua pasangan blok (kiri, kanan) diproses sekaligus: kunci
+    blok * n + rank membuat satu searchsorted global menghitung elemen kiri
+    yang lebih besar untuk setiap elemen kanan. Penggabungan blok memakai
+    sort stabil (timsort) yang mendeteksi dua run per blok → O(n) per level.
+    """
+    if np is None:
+        raise ImportError("countInversionsNumpy membutuhkan NumPy")
+    return _mergeCountNumpy(np.asarray(arr))[1]
+
+
+def _mergeCountNumpy(a):
+    """Inti countInversionsNumpy; kembalikan (ndarray_terurut, inversi)."""
+    n = len(a)
+    if n < 2:
+        return a.copy(), 0
+    values, ranks = np.unique(a, return_inverse=True)
+    ranks = ranks.astype(np.int64).ravel()
+    idx = np.arange(n, dtype=np.int64)
+    total = 0
+    width = 1
+    while width < n:
+        block = idx // (2 * width)
+        isRight = (idx // width) % 2 == 1
+        keys = block * n + ranks
+        leftKeys = keys[~isRight]
+        rightKeys = keys[isRight]
+        blockEnd = (block[isRight] + 1) * n
+        total += int((np.searchsorted(leftKeys, blockEnd, side="left")
+                      - np.searchsorted(leftKeys, rightKeys, side="right")).sum())
+        ranks = np.sort(keys, kind="stable") - block * n
+        width *= 2
+    return values[ranks], total
+
+
+class InversionTracker:
+    """
+    Jumlah inversi (jarak Kendall tau ke urutan terurut) yang dijaga secara
+    inkremental di atas Fenwick tree berindeks rank nilai:
+      - append(x)  : + banyak elemen yang sudah ada dan > x
+      - pop()      : hapus elemen terbaru
+      - popleft()  : hapus elemen terlama (dipakai otomatis bila window penuh)
+    Semua operasi O(log m), m = ukuran domain nilai. `domain` = semua nilai
+    yang mungkin muncul (mis. ID item pada ranking).
+    """
+
+    def __init__(self, domain, window=None):
+        self.rank = {v: r for r, v in enumerate(sorted(set(domain)), 1)}
+        self.tree = [0] * (len(self.rank) + 1)
+        self.items = deque()
+        self.window = window
+        self.inversions = 0
+
+    def _add(self, r, delta):
+        tree = self.tree
+        while r < len(tree):
+            tree[r] += delta
+            r += r & -r
+
+    def _prefix(self, r):
+        """Banyak elemen di struktur dengan rank <= r."""
+        total, tree = 0, self.tree
+        while r > 0:
+            total += tree[r]
+            r -= r & -r
+        return total
+
+    def __len__(self):
+        return len(self.items)
+
+    def append(self, x):
+        if self.window is not None and len(self.items) >= self.window:
+            self.popleft()
+        r = self.rank[x]
+        self.inversions += len(self.items) - self._prefix(r)
+        self._add(r, 1)
+        self.items.append(x)
+
+    def pop(self):
+        x = self.items.pop()
+        r = self.rank[x]
+        self._add(r, -1)
+        self.inversions -= len(self.items) - self._prefix(r)
+        return x
+
+    def popleft(self):
+        x = self.items.popleft()
+        r = self.rank[x]
+        self._add(r, -1)
+        self.inversions -= self._prefix(r - 1)
+        return x
+
+    def kendallTau(self):
+        """Koefisien Kendall tau terhadap urutan terurut (1 = terurut)."""
+        n = len(self.items)
+        pairs = n * (n - 1) // 2
+        return 1.0 if pairs == 0 else 1 - 2 * self.inversions / pairs
+
+
+def kendallTauDistance(rankingA, rankingB):
+    """Banyak pasangan item yang urutannya berbeda di dua ranking."""
+    if sorted(rankingA) != sorted(rankingB):
+        raise ValueError("Kedua ranking harus berisi item yang sama")
+    position = {item: i for i, item in enumerate(rankingA)}
+    return countInversionsFenwick([position[item] for item in rankingB])
+
+
+def kendallTau(rankingA, rankingB):
+    """Koefisien Kendall tau di [-1, 1] untuk dua ranking tanpa seri."""
+    n = len(rankingA)
+    pairs = n * (n - 1) // 2
+    return 1.0 if pairs == 0 else 1 - 2 * kendallTauDistance(rankingA, rankingB) / pairs
+
+
+def benchmarkInversions(sizes=(10**3, 10**4, 10**5), naiveLimit=10**4, seed=42):
+    """
+    Bandingkan semua varian penghitung inversi. Naive hanya dijalankan
+    sampai naiveLimit (O(n²)); ukuran hingga 10^7 layak untuk varian
+    NumPy, varian Python murni butuh puluhan detik di sana.
+    """
+    names = ["Naive", "Smart", "BottomUp", "Fenwick", "Parallel"] + (["NumPy"] if np is not None else [])
+    funcs = [countInversionsNaive, countInversionsSmart, countInversionsBottomUp,
+             countInversionsFenwick, countInversionsParallel, countInversionsNumpy]
+    print(f"{'Ukuran':>10} | " + " | ".join(f"{nm + ' (s)':>12}" for nm in names))
+    print("-" * (13 + 15 * len(names)))
+    rng = random.Random(seed)
+    for size in sizes:
+        data = [rng.randint(0, size) for _ in range(size)]
+        cells, results = [], set()
+        for nm, fn in zip(names, funcs):
+            if nm == "Naive" and size > naiveLimit:
+                cells.append(f"{'-':>12}")
+                continue
+            start = time.perf_counter()
+            results.add(fn(data))
+            cells.append(f"{time.perf_counter() - start:>12.4f}")
+        status = "✓" if len(results) == 1 else "✗ BEDA"
+        print(f"{size:>10,} | " + " | ".join(cells) + f"  {status}")
+
+
 # ============================================================
 # =====================  MAIN / UJI  ========================
 # ============================================================
@@ -246,6 +1351,15 @@ print(f"countOccurrences({arr}, 4)  → {countOccurrences(arr, 4)}")   # 4
 print(f"countOccurrences({arr}, 5)  → {countOccurrences(arr, 5)}")   # 0
 print(f"countOccurrences({arr}, 1)  → {countOccurrences(arr, 1)}")   # 1
 print(f"countOccurrences({arr}, 12) → {countOccurrences(arr, 12)}")  # 1
+targets = [4, 5, 1, 12]
+print(f"countOccurrencesBatch({arr}, {targets}) → {countOccurrencesBatch(arr, targets)}")
+if np is not None:
+    print(f"  (NumPy) → {countOccurrencesBatch(np.array(arr), targets).tolist()}")
+rle = CompressedSortedMultiset.fromSorted(arr)
+print(f"CompressedSortedMultiset: {len(rle.values)} nilai unik untuk {len(rle)} elemen")
+print(f"  count(4) = {rle.count(4)}, rank(7) = {rle.rank(7)}, countRange(2, 9) = {rle.countRange(2, 9)}")
+print("\nBenchmark layout pencarian (10^4 query):")
+benchmarkSearchLayouts(sizes=(10**5, 10**6))
 print()
 
 # --- Soal 2 ---
@@ -255,7 +1369,8 @@ print(SEP)
 
 input1 = [5, 1, 4, 2, 8]
 print(f"\nInput: {input1}")
-sorted1, cmp1, swp1, pass1 = bubbleSort(input1)
+cetakPass = lambda p, data: print(f"  Pass {p}: {data}")
+sorted1, cmp1, swp1, pass1 = bubbleSort(input1, onPass=cetakPass)
 print(f"  Sorted      : {sorted1}")
 print(f"  Comparisons : {cmp1}")
 print(f"  Swaps       : {swp1}")
@@ -263,7 +1378,7 @@ print(f"  Passes used : {pass1}")
 
 input2 = [1, 2, 3, 4, 5]
 print(f"\nInput: {input2}")
-sorted2, cmp2, swp2, pass2 = bubbleSort(input2)
+sorted2, cmp2, swp2, pass2 = bubbleSort(input2, onPass=cetakPass)
 print(f"  Sorted      : {sorted2}")
 print(f"  Comparisons : {cmp2}")
 print(f"  Swaps       : {swp2}")
@@ -295,9 +1410,25 @@ for n in sizes:
 print("""
 Catatan:
   - "ops" = total comparisons + total swaps
-  - Array <= 10 elemen → Insertion Sort; lebih besar → Selection Sort.
+  - Sub-array <= 10 elemen → Insertion Sort; lebih besar → dibelah dua
+    dan di-merge (merge sort), jadi Hybrid tetap O(n log n).
 """)
 
+print(f"Threshold terbaik di mesin ini: {tuneHybridThreshold(n=2000, repeats=2)}")
+rng = random.Random(1)
+nearly = makeDistribution("nearly-sorted", 2000, rng)
+_, ac, _ = adaptiveSort(nearly)
+_, ic, _ = insertionSort(nearly)
+_, hc, _ = hybridSort(nearly, threshold=10)
+print(f"Nearly-sorted n=2000 (comparisons) → Adaptive {ac:,} | Insertion {ic:,} | Hybrid {hc:,}")
+if "--tune-hybrid" in sys.argv:
+    # simpan profil threshold per distribusi untuk dipakai hybridSort
+    benchmarkHybridThresholds(save=True)
+
+print("Overhead instrumentasi (n = 2000):")
+benchmarkInstrumentation(2000)
+print()
+
 # --- Soal 4 ---
 print(SEP)
 print("SOAL 4 — Merge Tiga Sorted Lists")
@@ -321,6 +1452,38 @@ for a, b, c in tests:
     res = mergeThreeSortedLists(a, b, c)
     status = "✓" if res == sorted(a + b + c) else "✗"
     print(f"  {status} {a} + {b} + {c} → {res}")
+
+print("\nK-way merge (generator, tiap sumber dibaca lazy):")
+shards = [range(0, 20, 3), (x * x for x in range(5)), iter([2, 2, 7]), []]
+print(f"  → {list(mergeKSorted(shards))}")
+benchmarkKWayMerge(k=100, perList=300)
+
+if np is not None and __name__ == "__main__":
+    rng = np.random.default_rng(3)
+    big = [np.sort(rng.integers(0, 10**6, size=n)) for n in (400_000, 250_000, 350_000)]
+    start = time.perf_counter()
+    sequential = np.fromiter(mergeKSorted(big), dtype=np.int64)
+    t_seq = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = parallelMergeSorted(big, workers=4)
+    t_par = time.perf_counter() - start
+    status = "✓" if np.array_equal(sequential, parallel) else "✗"
+    print(f"\nParallel merge-path (4 worker, 10^6 elemen): {status} identik | "
+          f"sekuensial {t_seq:.3f} s | paralel {t_par:.3f} s")
+
+print("\nExternal merge sort (budget memori 8 KB, fan-in 4):")
+with tempfile.TemporaryDirectory() as tmp:
+    src, dst = os.path.join(tmp, "data.bin"), os.path.join(tmp, "sorted.bin")
+    random.seed(7)
+    values = [random.randint(-10**9, 10**9) for _ in range(20000)]
+    with open(src, "wb") as f:
+        array("q", values).tofile(f)
+    info = externalSort(src, dst, memoryLimit=8 * 1024, fanIn=4)
+    with open(dst, "rb") as f:
+        result = array("q", f.read())
+    status = "✓" if result.tolist() == sorted(values) else "✗"
+    print(f"  {status} {len(values):,} elemen → {info['runs']} run, {info['passes']} pass, "
+          f"baca {info['bytesRead']:,} B, tulis {info['bytesWritten']:,} B")
 print()
 
 # --- Soal 5 ---
@@ -360,3 +1523,16 @@ Penjelasan mengapa merge sort lebih cepat:
   • Merge Sort O(n log n) → ~130 ribu operasi untuk n=10000.
   • Semakin besar array, selisih kecepatannya semakin dramatis.
 """)
+
+if __name__ == "__main__":
+    # dijaga __main__: varian Parallel memakai proses anak
+    print("Varian lain: bottom-up (ping-pong buffer), Fenwick tree, paralel, dan NumPy:")
+    benchmarkInversions(sizes=(10**3, 10**4, 10**5), naiveLimit=5000)
+
+print("\nInversi inkremental (window 4) pada aliran ranking:")
+tracker = InversionTracker(range(10), window=4)
+for x in [3, 1, 4, 0, 5, 9, 2, 6]:
+    tracker.append(x)
+    print(f"  append {x} → window {list(tracker.items)}, inversi = {tracker.inversions}")
+A, B = ["a", "b", "c", "d", "e"], ["b", "a", "c", "e", "d"]
+print(f"  Kendall tau {A} vs {B}: jarak = {kendallTauDistance(A, B)}, tau = {kendallTau(A, B):.2f}")
@@ -1,24 +1,205 @@
 # ============================================================
 # SOAL 1: Big Integer ADT
-# (a) Menggunakan Singly Linked List
-# (b) Menggunakan Python List
+# (a) Menggunakan Singly Linked List (satu node per limb)
+# (b) Menggunakan Python List (limb basis 10^9 dalam array('I'))
 #
-# Digit disimpan dari least-significant ke most-significant.
-# Contoh: 45839 -> head -> [9] -> [8] -> [3] -> [5] -> [4]
+# Angka disimpan per limb basis 10^9 (9 digit desimal), dari
+# least-significant ke most-significant.
+# Contoh: 1234567890123 -> head -> [567890123] -> [1234]
+#         (b) limbs = [567890123, 1234]
 # ============================================================
 
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
 
 # ============================================================
 # BAGIAN (a): BigInteger dengan Singly Linked List
 # ============================================================
 
 class Node:
-    def __init__(self, digit):
-        self.digit = digit
+    """Satu node = satu limb basis 10^9 (9 digit desimal)."""
+    __slots__ = ('limb', 'next')
+
+    def __init__(self, limb):
+        self.limb = limb
         self.next = None
 
 
-class BigIntegerLinkedList:
+class NodePool:
+    """
+    Free-list node: rantai node yang sudah tidak dipakai disimpan dan
+    dipakai ulang sebelum membuat Node baru. Ukuran dibatasi `kapasitas`.
+    Hanya objek pemilik rantai yang boleh mengembalikannya (saat nilainya
+    ditimpa), bukan __del__, agar node tidak pernah masuk pool dua kali.
+    """
+
+    def __init__(self, kapasitas=1 << 20):
+        self.free = None
+        self.size = 0
+        self.kapasitas = kapasitas
+
+    def acquire(self, limb):
+        node = self.free
+        if node is None:
+            return Node(limb)
+        self.free = node.next
+        self.size -= 1
+        node.limb = limb
+        node.next = None
+        return node
+
+    def release_chain(self, head):
+        """Kembalikan seluruh rantai mulai `head` ke free-list."""
+        while head is not None and self.size < self.kapasitas:
+            nxt = head.next
+            head.next = self.free
+            self.free = head
+            self.size += 1
+            head = nxt
+
+
+_node_pool = NodePool()
+
+
+class _OperatorBigInteger:
+    """
+    Operator Python (+, -, <, ==, hash, ...) untuk kedua kelas BigInteger.
+    Kelas turunan menyediakan _nilai() -> (negatif, limbs); setiap operator
+    langsung memanggil fungsi limb tanpa lookup string operator.
+    """
+
+    def _cmp(self, other):
+        """-1, 0, 1. Tanda dicek dulu, lalu jumlah limb, baru isi limb."""
+        if self.negative != other.negative:
+            return -1 if self.negative else 1
+        c = _cmp_mag(self._nilai()[1], other._nilai()[1])
+        return -c if self.negative else c
+
+    def _baru(self, hasil):
+        return type(self)._from_limbs(hasil[1], hasil[0])
+
+    def __add__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._baru(_s_add(self._nilai(), other._nilai()))
+
+    def __sub__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._baru(_s_sub(self._nilai(), other._nilai()))
+
+    def __mul__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._baru(_s_mul(self._nilai(), other._nilai()))
+
+    def __floordiv__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._baru(_s_divmod(self._nilai(), other._nilai())[0])
+
+    def __mod__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._baru(_s_divmod(self._nilai(), other._nilai())[1])
+
+    def __divmod__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        q, r = _s_divmod(self._nilai(), other._nilai())
+        return self._baru(q), self._baru(r)
+
+    def __pow__(self, other, modulus=None):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        if modulus is None:
+            return self._baru(_s_pow(self._nilai(), other._nilai()))
+        return self._baru(_s_modpow(self._nilai(), other._nilai(), modulus._nilai()))
+
+    def __neg__(self):
+        negative, limbs = self._nilai()
+        return type(self)._from_limbs(array('I', limbs), not negative)
+
+    def __abs__(self):
+        return type(self)._from_limbs(array('I', self._nilai()[1]), False)
+
+    def __or__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return type(self)._from_int(self._to_int() | other._to_int())
+
+    def __and__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return type(self)._from_int(self._to_int() & other._to_int())
+
+    def __xor__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return type(self)._from_int(self._to_int() ^ other._to_int())
+
+    def __lshift__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return type(self)._from_int(self._to_int() << other._to_int())
+
+    def __rshift__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return type(self)._from_int(self._to_int() >> other._to_int())
+
+    def __eq__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) == 0
+
+    def __ne__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) != 0
+
+    def __lt__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) < 0
+
+    def __le__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) <= 0
+
+    def __gt__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) > 0
+
+    def __ge__(self, other):
+        if not isinstance(other, _OperatorBigInteger):
+            return NotImplemented
+        return self._cmp(other) >= 0
+
+    def __hash__(self):
+        negative, limbs = self._nilai()
+        return hash((negative, limbs.tobytes()))
+
+    def __bool__(self):
+        return bool(self._nilai()[1])
+
+    def __int__(self):
+        return self._to_int()
+
+    def __str__(self):
+        return self.toString()
+
+    def __repr__(self):
+        return f"{type(self).__name__}('{self.toString()}')"
+
+
+class BigIntegerLinkedList(_OperatorBigInteger):
     def __init__(self, initValue="0"):
         """Membuat BigInteger dari string. Contoh: BigIntegerLinkedList('45839')"""
         self.head = None
@@ -26,7 +207,7 @@ class BigIntegerLinkedList:
         self._parse(str(initValue))
 
     def _parse(self, s):
-        """Parse string angka ke dalam linked list (least-significant di head)."""
+        """Parse string angka ke dalam linked list limb (least-significant di head)."""
         s = s.strip()
         if s.startswith('-'):
             self.negative = True
@@ -35,36 +216,63 @@ class BigIntegerLinkedList:
             self.negative = False
 
         s = s.lstrip('0') or '0'
+        if not s.isdigit() or not s.isascii():
+            raise ValueError(f"Bukan bilangan bulat: {s!r}")
+        self._set_limbs(_limbs_from_str(s))
+        if self.head is None:
+            self.negative = False
 
+    def _set_limbs(self, limbs):
+        """Ganti isi linked list dengan `limbs`; node lama kembali ke pool."""
+        _node_pool.release_chain(self.head)
         self.head = None
-        # Sisipkan setiap digit di depan (prepend) ->
-        # digit paling kanan (least-significant) akhirnya jadi head
-        for ch in s:
-            node = Node(int(ch))
+        # Sisipkan limb dari yang paling signifikan di depan (prepend) ->
+        # limb paling rendah akhirnya jadi head
+        for i in range(len(limbs) - 1, -1, -1):
+            node = _node_pool.acquire(limbs[i])
             node.next = self.head
             self.head = node
 
+    def __copy__(self):
+        # Salinan punya rantai node sendiri: node hanya dikembalikan ke pool
+        # oleh pemiliknya (_set_limbs), jadi rantai tidak boleh dibagi
+        return type(self)._from_limbs(self._limb_view(), self.negative)
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
     def _to_int(self):
         """Konversi linked list ke integer Python."""
-        return int(self.toString())
+        return _limbs_to_int(self._limb_view()) * (-1 if self.negative else 1)
+
+    def _limb_view(self):
+        """Limb basis 10^9 dari linked list (tanpa tanda), index 0 = head."""
+        limbs = array('I')
+        curr = self.head
+        while curr:
+            limbs.append(curr.limb)
+            curr = curr.next
+        return limbs
+
+    @classmethod
+    def _from_limbs(cls, limbs, negative):
+        obj = cls.__new__(cls)
+        obj.head = None
+        obj._set_limbs(limbs)
+        obj.negative = negative and obj.head is not None
+        return obj
 
     @classmethod
     def _from_int(cls, value):
         """Buat BigIntegerLinkedList dari integer Python."""
-        return cls(str(value))
+        return cls._from_limbs(_limbs_from_int(abs(value)), value < 0)
 
     def toString(self):
         """
         Kembalikan representasi string dari big integer.
         Traverse linked list (least -> most significant), lalu balik.
         """
-        digits = []
-        curr = self.head
-        while curr:
-            digits.append(str(curr.digit))
-            curr = curr.next
-        result = ''.join(reversed(digits)) if digits else '0'
-        result = result.lstrip('0') or '0'
+        result = _limbs_to_str(self._limb_view())
         return ('-' + result) if self.negative and result != '0' else result
 
     def comparable(self, other, op):
@@ -73,19 +281,26 @@ class BigIntegerLinkedList:
         op: '<', '<=', '>', '>=', '==', '!='
         Kembalikan True atau False.
         """
-        a = self._to_int()
-        b = other._to_int()
-        ops = {
-            '<':  a < b,
-            '<=': a <= b,
-            '>':  a > b,
-            '>=': a >= b,
-            '==': a == b,
-            '!=': a != b,
-        }
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return ops[op]
+        return _hasil_banding(self._cmp(other), op)
+
+    def _nilai(self):
+        return (self.negative, self._limb_view())
+
+    def _cmp(self, other):
+        """Tanpa menyalin limb: telusuri kedua list bersamaan dari head."""
+        if not isinstance(other, BigIntegerLinkedList):
+            return super()._cmp(other)
+        if self.negative != other.negative:
+            return -1 if self.negative else 1
+        # Selisih terakhir yang ditemui = selisih di limb paling signifikan
+        a, b, c = self.head, other.head, 0
+        while a and b:
+            if a.limb != b.limb:
+                c = -1 if a.limb < b.limb else 1
+            a, b = a.next, b.next
+        if a or b:
+            c = 1 if a else -1  # jumlah limb berbeda
+        return -c if self.negative else c
 
     def arithmetic(self, rhsInt, op):
         """
@@ -93,16 +308,16 @@ class BigIntegerLinkedList:
         op: '+', '-', '*', '//', '%', '**'
         Kembalikan BigIntegerLinkedList baru.
         """
-        a = self._to_int()
-        b = rhsInt._to_int()
-        if   op == '+':  result = a + b
-        elif op == '-':  result = a - b
-        elif op == '*':  result = a * b
-        elif op == '//': result = a // b
-        elif op == '%':  result = a % b
-        elif op == '**': result = a ** b
-        else: raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerLinkedList._from_int(result)
+        negative, limbs = _s_arith(self._nilai(), rhsInt._nilai(), op)
+        return type(self)._from_limbs(limbs, negative)
+
+    def modpow(self, exponent, modulus):
+        """
+        (self ** exponent) % modulus tanpa menghitung pangkat penuh.
+        Kembalikan BigIntegerLinkedList baru.
+        """
+        negative, limbs = _s_modpow(self._nilai(), exponent._nilai(), modulus._nilai())
+        return type(self)._from_limbs(limbs, negative)
 
     def bitwise_ops(self, rhsInt, op):
         """
@@ -112,40 +327,751 @@ class BigIntegerLinkedList:
         """
         a = self._to_int()
         b = rhsInt._to_int()
-        ops = {
-            '|':  a | b,
-            '&':  a & b,
-            '^':  a ^ b,
-            '<<': a << b,
-            '>>': a >> b,
-        }
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerLinkedList._from_int(ops[op])
+        if   op == '|':  result = a | b
+        elif op == '&':  result = a & b
+        elif op == '^':  result = a ^ b
+        elif op == '<<': result = a << b
+        elif op == '>>': result = a >> b
+        else: raise ValueError(f"Operator tidak dikenal: {op}")
+        return type(self)._from_int(result)
 
     def print_linked_list(self):
-        """Tampilkan struktur linked list secara visual."""
+        """Tampilkan struktur linked list secara visual (satu kotak = satu limb)."""
         curr = self.head
         nodes = []
         while curr:
-            nodes.append(f"[{curr.digit}|*]")
+            nodes.append(f"[{curr.limb:09d}|*]" if curr.next else f"[{curr.limb}|*]")
             curr = curr.next
         print("head -> " + " -> ".join(nodes))
 
 
+# ============================================================
+# ARITMATIKA LIMB (basis 10^9)
+# Magnitudo disimpan sebagai array('I') little-endian: limb[0] adalah
+# 9 digit desimal paling rendah. Nol = array kosong (tanpa limb).
+# ============================================================
+
+BASE = 10 ** 9
+BASE_DIGITS = 9
+
+
+def _trim(limbs):
+    """Buang limb nol di posisi paling signifikan."""
+    while limbs and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+def _cmp_mag(a, b):
+    """Bandingkan magnitudo: -1, 0, atau 1."""
+    if len(a) != len(b):
+        return -1 if len(a) < len(b) else 1
+    for i in range(len(a) - 1, -1, -1):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+def _add_mag(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    result = array('I', bytes(4 * (len(a) + 1)))
+    carry = 0
+    for i in range(len(b)):
+        carry += a[i] + b[i]
+        if carry >= BASE:
+            result[i] = carry - BASE
+            carry = 1
+        else:
+            result[i] = carry
+            carry = 0
+    for i in range(len(b), len(a)):
+        carry += a[i]
+        if carry >= BASE:
+            result[i] = carry - BASE
+            carry = 1
+        else:
+            result[i] = carry
+            carry = 0
+    result[len(a)] = carry
+    return _trim(result)
+
+
+def _sub_mag(a, b):
+    """a - b dengan syarat |a| >= |b|."""
+    result = array('I', a)
+    borrow = 0
+    for i in range(len(b)):
+        d = a[i] - b[i] - borrow
+        if d < 0:
+            result[i] = d + BASE
+            borrow = 1
+        else:
+            result[i] = d
+            borrow = 0
+    i = len(b)
+    while borrow:
+        d = a[i] - 1
+        if d < 0:
+            result[i] = BASE - 1
+        else:
+            result[i] = d
+            borrow = 0
+        i += 1
+    return _trim(result)
+
+
+def _mul_small(a, m):
+    """a * m untuk 0 <= m < BASE."""
+    if m == 0 or not a:
+        return array('I')
+    result = array('I', bytes(4 * (len(a) + 1)))
+    carry = 0
+    for i in range(len(a)):
+        carry, result[i] = divmod(a[i] * m + carry, BASE)
+    result[len(a)] = carry
+    return _trim(result)
+
+
+def _mul_schoolbook(a, b):
+    """Perkalian schoolbook O(n·m)."""
+    if not a or not b:
+        return array('I')
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) == 1:
+        return _mul_small(a, b[0])
+    acc = [0] * (len(a) + len(b))
+    for i, bi in enumerate(b):
+        if bi == 0:
+            continue
+        carry = 0
+        k = i
+        for aj in a:
+            carry, acc[k] = divmod(acc[k] + aj * bi + carry, BASE)
+            k += 1
+        while carry:
+            carry, acc[k] = divmod(acc[k] + carry, BASE)
+            k += 1
+    return _trim(array('I', acc))
+
+
+# Batas jumlah limb operand terpendek; ditentukan lewat benchmark_perkalian()
+KARATSUBA_CUTOFF = 32
+TOOM3_CUTOFF = 300
+
+
+def _mul_mag(a, b):
+    """Perkalian magnitudo: schoolbook → Karatsuba → Toom-3 sesuai ukuran."""
+    n = min(len(a), len(b))
+    if n < KARATSUBA_CUTOFF:
+        return _mul_schoolbook(a, b)
+    if n < TOOM3_CUTOFF:
+        return _mul_karatsuba(a, b)
+    return _mul_toom3(a, b)
+
+
+def _shift(limbs, k):
+    """limbs * BASE^k."""
+    if not limbs or k == 0:
+        return limbs
+    return array('I', bytes(4 * k)) + limbs
+
+
+def _split(a, k, parts):
+    """Pecah a menjadi `parts` potongan berukuran k limb (paling rendah dulu)."""
+    return [_trim(a[i * k:(i + 1) * k]) for i in range(parts - 1)] + [_trim(a[(parts - 1) * k:])]
+
+
+def _mul_karatsuba(a, b):
+    """
+    Karatsuba O(n^1.585): dengan a = a1·X + a0 dan b = b1·X + b0,
+    a·b = z2·X² + ((a0+a1)(b0+b1) - z2 - z0)·X + z0.
+    """
+    k = max(len(a), len(b)) // 2
+    a0, a1 = _split(a, k, 2)
+    b0, b1 = _split(b, k, 2)
+    if not b1:                          # operand tidak seimbang
+        return _add_mag(_mul_mag(a0, b0), _shift(_mul_mag(a1, b0), k))
+    if not a1:
+        return _add_mag(_mul_mag(a0, b0), _shift(_mul_mag(a0, b1), k))
+    z0 = _mul_mag(a0, b0)
+    z2 = _mul_mag(a1, b1)
+    z1 = _sub_mag(_sub_mag(_mul_mag(_add_mag(a0, a1), _add_mag(b0, b1)), z2), z0)
+    return _add_mag(_add_mag(z0, _shift(z1, k)), _shift(z2, 2 * k))
+
+
+# Nilai bertanda untuk Toom-3: pasangan (negatif, limbs)
+
+def _s_add(x, y):
+    (xn, xa), (yn, ya) = x, y
+    if xn == yn:
+        return (xn, _add_mag(xa, ya))
+    c = _cmp_mag(xa, ya)
+    if c == 0:
+        return (False, array('I'))
+    if c > 0:
+        return (xn, _sub_mag(xa, ya))
+    return (yn, _sub_mag(ya, xa))
+
+
+def _s_sub(x, y):
+    return _s_add(x, (not y[0] and bool(y[1]), y[1]))
+
+
+def _s_mul(x, y):
+    limbs = _mul_mag(x[1], y[1])
+    return (x[0] != y[0] and bool(limbs), limbs)
+
+
+def _s_scale(x, m):
+    return (x[0], _mul_small(x[1], m))
+
+
+def _s_div_exact(x, d):
+    return (x[0], _divmod_small(x[1], d)[0])
+
+
+def _mul_toom3(a, b):
+    """
+    Toom-Cook 3 O(n^1.465): polinom derajat 2 dievaluasi di 0, 1, -1, -2, ∞,
+    lima hasil kali dihitung rekursif, lalu diinterpolasi (urutan Bodrato).
+    """
+    k = (max(len(a), len(b)) + 2) // 3
+    if min(len(a), len(b)) <= k:        # operand terlalu timpang untuk Toom-3
+        return _mul_karatsuba(a, b)
+
+    def evaluate(x):
+        x0, x1, x2 = ((False, part) for part in _split(x, k, 3))
+        p = _s_add(x0, x2)
+        at_1 = _s_add(p, x1)
+        at_m1 = _s_sub(p, x1)
+        at_m2 = _s_sub(_s_scale(_s_add(at_m1, x2), 2), x0)
+        return x0, at_1, at_m1, at_m2, x2
+
+    ea, eb = evaluate(a), evaluate(b)
+    r0, r_1, r_m1, r_m2, r_inf = (_s_mul(p, q) for p, q in zip(ea, eb))
+
+    r3 = _s_div_exact(_s_sub(r_m2, r_1), 3)
+    r1 = _s_div_exact(_s_sub(r_1, r_m1), 2)
+    r2 = _s_sub(r_m1, r0)
+    r3 = _s_add(_s_div_exact(_s_sub(r2, r3), 2), _s_scale(r_inf, 2))
+    r2 = _s_sub(_s_add(r2, r1), r_inf)
+    r1 = _s_sub(r1, r3)
+
+    result = r0[1]
+    for i, (neg, limbs) in enumerate((r1, r2, r3, r_inf), 1):
+        assert not neg, "koefisien Toom-3 tidak boleh negatif"
+        result = _add_mag(result, _shift(limbs, i * k))
+    return result
+
+
+def _divmod_small(a, m):
+    """(a // m, a % m) untuk 0 < m < BASE."""
+    q = array('I', bytes(4 * len(a)))
+    rem = 0
+    for i in range(len(a) - 1, -1, -1):
+        q[i], rem = divmod(rem * BASE + a[i], m)
+    return _trim(q), rem
+
+
+def _divmod_mag(a, b):
+    """Pembagian panjang (Knuth Algorithm D) untuk magnitudo, b ≠ 0."""
+    if _cmp_mag(a, b) < 0:
+        return array('I'), array('I', a)
+    if len(b) == 1:
+        q, r = _divmod_small(a, b[0])
+        return q, (array('I', [r]) if r else array('I'))
+
+    # Normalisasi: limb teratas pembagi >= BASE/2 agar tebakan qhat akurat
+    d = BASE // (b[-1] + 1)
+    u = list(_mul_small(a, d)) if d > 1 else list(a)
+    v = list(_mul_small(b, d)) if d > 1 else list(b)
+    u.extend([0] * (len(a) + 1 - len(u)))
+    n, m = len(v), len(u) - len(v)
+    q = [0] * m
+    v1, v2 = v[-1], v[-2]
+    for j in range(m - 1, -1, -1):
+        top = u[j + n] * BASE + u[j + n - 1]
+        qhat, rhat = divmod(top, v1)
+        while qhat >= BASE or qhat * v2 > rhat * BASE + u[j + n - 2]:
+            qhat -= 1
+            rhat += v1
+            if rhat >= BASE:
+                break
+        # u[j:j+n+1] -= qhat * v
+        borrow = carry = 0
+        for i in range(n):
+            carry, p = divmod(qhat * v[i] + carry, BASE)
+            t = u[i + j] - p - borrow
+            if t < 0:
+                u[i + j] = t + BASE
+                borrow = 1
+            else:
+                u[i + j] = t
+                borrow = 0
+        t = u[j + n] - carry - borrow
+        if t < 0:
+            # qhat kebesaran satu: tambahkan kembali v
+            u[j + n] = t + BASE
+            qhat -= 1
+            carry = 0
+            for i in range(n):
+                carry, u[i + j] = divmod(u[i + j] + v[i] + carry, BASE)
+            u[j + n] = (u[j + n] + carry) % BASE
+        else:
+            u[j + n] = t
+        q[j] = qhat
+
+    r = _trim(array('I', u[:n]))
+    if d > 1:
+        r, _ = _divmod_small(r, d)
+    return _trim(array('I', q)), r
+
+
+def _limbs_from_str(s):
+    """String digit desimal (tanpa tanda) → limb little-endian."""
+    limbs = array('I', [int(s[max(0, i - BASE_DIGITS):i])
+                        for i in range(len(s), 0, -BASE_DIGITS)])
+    return _trim(limbs)
+
+
+def _limbs_to_str(limbs):
+    if not limbs:
+        return '0'
+    return str(limbs[-1]) + ''.join(f"{x:09d}" for x in reversed(limbs[:-1]))
+
+
+# Konversi limb desimal <-> integer biner (dipakai operasi bitwise dan
+# eksponen). Di atas KONVERSI_CUTOFF limb dipakai divide-and-conquer:
+# bilangan dibelah dua di posisi 2^k limb dengan pangkat BASE^(2^k)
+# = 10^(9*2^k) yang di-cache. Arah limb -> int hanya butuh perkalian.
+# Arah int -> limb butuh divmod, dan divmod int Python kuadratik, jadi
+# hasil bagi dihitung lewat kebalikan fixed-point BASE^(2^k) yang juga
+# di-cache (Barrett). Dengan begitu tiap level hanya berisi perkalian
+# besar (Karatsuba bawaan int Python), bukan kuadratik.
+KONVERSI_CUTOFF = 64
+_pangkat_base = {1: BASE}  # h -> BASE ** h, h pangkat dua
+_kebalikan_base = {}       # h -> (k, floor(2^(2k) / BASE ** h)), k = bit BASE ** h
+
+
+def _base_pow(h):
+    p = _pangkat_base.get(h)
+    if p is None:
+        p = _base_pow(h // 2) ** 2
+        _pangkat_base[h] = p
+    return p
+
+
+def _kebalikan_base_pow(h):
+    """
+    (k, floor(2^(2k) / BASE^h)). Kebalikan level h dibangun dari kuadrat
+    kebalikan level h/2 (akurat ~k/2 bit), satu langkah Newton
+    x += x * (2^(2k) - d*x) / 2^(2k), lalu koreksi sisa agar tepat.
+    """
+    hasil = _kebalikan_base.get(h)
+    if hasil is not None:
+        return hasil
+    d = _base_pow(h)
+    k = d.bit_length()
+    satu = 1 << (2 * k)
+    if h <= KONVERSI_CUTOFF:
+        x = satu // d
+    else:
+        k2, x2 = _kebalikan_base_pow(h // 2)
+        x = (x2 * x2) >> (4 * k2 - 2 * k)
+        x += (x * (satu - d * x)) >> (2 * k)
+        sisa = satu - d * x
+        while sisa < 0:
+            x -= 1
+            sisa += d
+        while sisa >= d:
+            x += 1
+            sisa -= d
+    _kebalikan_base[h] = hasil = (k, x)
+    return hasil
+
+
+def _divmod_base_pow(v, h):
+    """divmod(v, BASE^h) untuk 0 <= v < BASE^(2h), tanpa pembagian besar."""
+    d = _base_pow(h)
+    k, x = _kebalikan_base_pow(h)
+    # Barrett: cukup bit atas v; hasil bagi paling banyak kurang 2
+    q = ((v >> (k - 1)) * x) >> (k + 1)
+    r = v - q * d
+    while r >= d:
+        q += 1
+        r -= d
+    return q, r
+
+
+def _limbs_from_int_naif(value, limbs, n=None):
+    """Tambahkan limb `value` ke `limbs` (tepat n limb kalau n diberikan)."""
+    if n is None:
+        while value:
+            value, r = divmod(value, BASE)
+            limbs.append(r)
+    else:
+        for _ in range(n):
+            value, r = divmod(value, BASE)
+            limbs.append(r)
+
+
+def _limbs_to_int_naif(limbs, lo=0, hi=None):
+    value = 0
+    for i in range(len(limbs) - 1 if hi is None else hi - 1, lo - 1, -1):
+        value = value * BASE + limbs[i]
+    return value
+
+
+def _limbs_from_int(value):
+    """Integer Python non-negatif → limb."""
+    limbs = array('I')
+    # Perkiraan jumlah limb dari panjang bit (log2(10^9) > 29.89)
+    perkiraan = value.bit_length() // 29 + 1
+    if perkiraan <= KONVERSI_CUTOFF:
+        _limbs_from_int_naif(value, limbs)
+        return limbs
+
+    def isi(v, n):
+        # v < BASE^n, n pangkat dua -> tambahkan tepat n limb
+        if n <= KONVERSI_CUTOFF:
+            _limbs_from_int_naif(v, limbs, n)
+            return
+        h = n // 2
+        atas, bawah = _divmod_base_pow(v, h)
+        isi(bawah, h)
+        isi(atas, h)
+
+    n = 1
+    while n < perkiraan:
+        n *= 2
+    isi(value, n)
+    return _trim(limbs)
+
+
+def _limbs_to_int(limbs):
+    """Limb → integer Python non-negatif."""
+
+    def gabung(lo, hi):
+        n = hi - lo
+        if n <= KONVERSI_CUTOFF:
+            return _limbs_to_int_naif(limbs, lo, hi)
+        h = 1
+        while h * 2 < n:
+            h *= 2
+        return gabung(lo + h, hi) * _base_pow(h) + gabung(lo, lo + h)
+
+    return gabung(0, len(limbs))
+
+
+def _s_divmod(x, y):
+    """Pembagian floor seperti // dan % Python."""
+    (xn, xa), (yn, ya) = x, y
+    if not ya:
+        raise ZeroDivisionError("Pembagian dengan nol")
+    q, r = _divmod_mag(xa, ya)
+    if xn != yn and r:
+        q = _add_mag(q, array('I', [1]))
+        r = _sub_mag(ya, r)
+    return (xn != yn and bool(q), q), (yn and bool(r), r)
+
+
+def _s_pow(x, y):
+    if y[0]:
+        raise ValueError("Eksponen negatif tidak didukung")
+    e = _limbs_to_int(y[1])
+    negative = x[0] and e & 1 == 1
+    result, base = array('I', [1]), x[1]
+    while e:
+        if e & 1:
+            result = _mul_mag(result, base)
+        e >>= 1
+        if e:
+            base = _mul_mag(base, base)
+    return (negative and bool(result), result)
+
+
+def _s_arith(x, y, op):
+    """Operasi aritmatika pada nilai bertanda (negatif, limbs)."""
+    if   op == '+':  return _s_add(x, y)
+    elif op == '-':  return _s_sub(x, y)
+    elif op == '*':  return _s_mul(x, y)
+    elif op == '//': return _s_divmod(x, y)[0]
+    elif op == '%':  return _s_divmod(x, y)[1]
+    elif op == '**': return _s_pow(x, y)
+    raise ValueError(f"Operator tidak dikenal: {op}")
+
+
+def _hasil_banding(c, op):
+    """Hasil perbandingan tiga arah `c` untuk operator string `op`."""
+    if   op == '<':  return c < 0
+    elif op == '<=': return c <= 0
+    elif op == '>':  return c > 0
+    elif op == '>=': return c >= 0
+    elif op == '==': return c == 0
+    elif op == '!=': return c != 0
+    raise ValueError(f"Operator tidak dikenal: {op}")
+
+
+# ============================================================
+# PERPANGKATAN MODULAR: sliding window + reduksi Montgomery
+# Montgomery dengan R = BASE^n (n = jumlah limb modulus) butuh
+# gcd(m, BASE) = 1, yaitu m tidak habis dibagi 2 maupun 5. Modulus
+# lain memakai sliding window yang sama dengan reduksi biasa (divmod).
+# ============================================================
+
+def _lebar_jendela(bit):
+    """Lebar jendela (bit) untuk eksponen sepanjang `bit`."""
+    for w, batas in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 672)):
+        if bit <= batas:
+            return w
+    return 6
+
+
+def _pow_jendela(basis, e, kali, satu):
+    """Sliding window kiri-ke-kanan: basis^e dengan perkalian `kali`."""
+    bit = bin(e)[2:]
+    w = _lebar_jendela(len(bit))
+    # Tabel pangkat ganjil: basis^1, basis^3, ..., basis^(2^w - 1)
+    tabel = {1: basis}
+    if w > 1:
+        kuadrat = kali(basis, basis)
+        for k in range(3, 1 << w, 2):
+            tabel[k] = kali(tabel[k - 2], kuadrat)
+    hasil, i = satu, 0
+    while i < len(bit):
+        if bit[i] == '0':
+            hasil = kali(hasil, hasil)
+            i += 1
+            continue
+        j = min(i + w, len(bit))
+        while bit[j - 1] == '0':
+            j -= 1
+        for _ in range(j - i):
+            hasil = kali(hasil, hasil)
+        hasil = kali(hasil, tabel[int(bit[i:j], 2)])
+        i = j
+    return hasil
+
+
+class _Montgomery:
+    """Konteks Montgomery untuk modulus m (limb) dengan gcd(m, 10) = 1."""
+
+    def __init__(self, m):
+        self.m = m
+        self.n = len(m)
+        self.m_list = m.tolist()
+        # m' = -m^-1 mod BASE (cukup limb terendah untuk REDC per limb)
+        self.m_aksen = -pow(m[0], -1, BASE) % BASE
+
+    def redc(self, t):
+        """t * R^-1 mod m untuk 0 <= t < m * R (REDC limb demi limb)."""
+        n, m = self.n, self.m_list
+        t = t.tolist()
+        t.extend([0] * (2 * n + 1 - len(t)))
+        for i in range(n):
+            # Limb ke-i dijadikan kelipatan BASE dengan menambah u*m*BASE^i;
+            # carry ditunda (int Python tidak overflow) dan hanya limb i
+            # yang dinormalkan ke limb berikutnya
+            u = t[i] * self.m_aksen % BASE
+            if u:
+                t[i:i + n] = [x + u * y for x, y in zip(t[i:i + n], m)]
+            t[i + 1] += t[i] // BASE
+        hasil = array('I', bytes(4 * (n + 1)))
+        carry = 0
+        for i in range(n + 1):
+            carry, hasil[i] = divmod(t[n + i] + carry, BASE)
+        hasil = _trim(hasil)
+        if _cmp_mag(hasil, self.m) >= 0:
+            hasil = _sub_mag(hasil, self.m)
+        return hasil
+
+    def ke_mont(self, a):
+        return _divmod_mag(_shift(a, self.n), self.m)[1]
+
+    def kali(self, a, b):
+        return self.redc(_mul_mag(a, b))
+
+
+def _modpow_mag(a, e, m):
+    """a^e mod m pada limb (a, m magnitudo; e int Python >= 0)."""
+    if _cmp_mag(m, array('I', [1])) == 0:
+        return array('I')
+    a = _divmod_mag(a, m)[1]
+    if e == 0:
+        return array('I', [1])
+    if not a:
+        return array('I')
+    if m[0] % 2 and m[0] % 5:
+        ctx = _Montgomery(m)
+        hasil = _pow_jendela(ctx.ke_mont(a), e, ctx.kali, ctx.ke_mont(array('I', [1])))
+        return ctx.redc(hasil)
+    return _pow_jendela(a, e, lambda x, y: _divmod_mag(_mul_mag(x, y), m)[1], array('I', [1]))
+
+
+def _s_modpow(x, y, z):
+    """pow(x, y, z) bertanda dengan semantik modulo Python."""
+    if y[0]:
+        raise ValueError("Eksponen negatif tidak didukung")
+    if not z[1]:
+        raise ValueError("Modulus tidak boleh nol")
+    r = _modpow_mag(x[1], _limbs_to_int(y[1]), z[1])
+    # Basis negatif dengan eksponen ganjil: hasil = m - r
+    if x[0] and y[1] and y[1][0] & 1 and r:
+        r = _sub_mag(z[1], r)
+    # Modulus negatif: hasil di (m, 0]
+    if z[0] and r:
+        return (True, _sub_mag(z[1], r))
+    return (False, r)
+
+
+def benchmark_modpow(ukuran_bit=(128, 256, 512, 1024), seed=0):
+    """Bandingkan modpow limb (Montgomery dan fallback) dengan pow(a, b, m)."""
+    rng = random.Random(seed)
+    print(f"{'bit':>6} | {'Montgomery':>11} | {'fallback':>10} | {'pow()':>10}")
+    print("-" * 46)
+    for bit in ukuran_bit:
+        a, e = rng.getrandbits(bit), rng.getrandbits(bit) | (1 << (bit - 1))
+        m = rng.getrandbits(bit) | (1 << (bit - 1)) | 1
+        while m % 5 == 0:
+            m += 2
+        hasil = []
+        for mod in (m, m + 1):  # ganjil & bukan kelipatan 5 -> Montgomery; genap -> fallback
+            A, E, M = BigIntegerList(str(a)), BigIntegerList(str(e)), BigIntegerList(str(mod))
+            mulai = time.perf_counter()
+            r = A.modpow(E, M)
+            hasil.append(time.perf_counter() - mulai)
+            assert r._to_int() == pow(a, e, mod)
+        mulai = time.perf_counter()
+        pow(a, e, m)
+        t_py = time.perf_counter() - mulai
+        print(f"{bit:>6} | {hasil[0]:>10.4f}s | {hasil[1]:>9.4f}s | {t_py:>9.6f}s")
+
+
+class DigitNode:
+    """Layout lama (satu node per digit, dengan __dict__) — hanya untuk benchmark."""
+
+    def __init__(self, digit):
+        self.digit = digit
+        self.next = None
+
+
+def benchmark_layout(jumlah_digit=200_000, seed=0):
+    """Bandingkan memori dan waktu traversal layout per-digit vs per-limb."""
+    rng = random.Random(seed)
+    s = str(rng.randint(1, 9)) + ''.join(rng.choice('0123456789') for _ in range(jumlah_digit - 1))
+
+    def ukur(bangun):
+        tracemalloc.start()
+        pemilik, head = bangun()
+        memori, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        mulai = time.perf_counter()
+        curr, n = head, 0
+        while curr:
+            n += 1
+            curr = curr.next
+        return pemilik, memori, time.perf_counter() - mulai, n
+
+    def per_digit():
+        head = None
+        for ch in s:
+            node = DigitNode(int(ch))
+            node.next = head
+            head = node
+        return head, head
+
+    def per_limb():
+        obj = BigIntegerLinkedList(s)
+        return obj, obj.head
+
+    print(f"  {jumlah_digit:,} digit")
+    print(f"  {'Layout':<10} | {'Node':>9} | {'Memori':>10} | {'Traversal':>10}")
+    print("  " + "-" * 48)
+    for nama, bangun in (("per-digit", per_digit), ("per-limb", per_limb)):
+        _, memori, waktu, n = ukur(bangun)
+        print(f"  {nama:<10} | {n:>9,} | {memori / 2**20:>6.2f} MiB | {waktu * 1000:>7.2f} ms")
+
+
+def benchmark_perkalian(ukuran=(8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512),
+                        ulang=3, terapkan=False, seed=0):
+    """
+    Sapu ukuran operand (dalam limb) dan bandingkan satu level
+    schoolbook vs Karatsuba vs Toom-3 (sub-perkalian tetap lewat
+    _mul_mag). Crossover = ukuran terkecil di mana metode yang lebih
+    canggih mulai lebih cepat. terapkan=True → pasang sebagai cutoff.
+    """
+    global KARATSUBA_CUTOFF, TOOM3_CUTOFF
+    rng = random.Random(seed)
+
+    def waktu(f, a, b):
+        terbaik = float("inf")
+        for _ in range(ulang):
+            mulai = time.perf_counter()
+            f(a, b)
+            terbaik = min(terbaik, time.perf_counter() - mulai)
+        return terbaik
+
+    cross_k = cross_t = None
+    print(f"{'limb':>6} | {'digit':>7} | {'schoolbook':>11} | {'karatsuba':>10} | {'toom-3':>10}")
+    print("-" * 56)
+    for n in ukuran:
+        a = array('I', [rng.randrange(1, BASE) for _ in range(n)])
+        b = array('I', [rng.randrange(1, BASE) for _ in range(n)])
+        t_s = waktu(_mul_schoolbook, a, b)
+        t_k = waktu(_mul_karatsuba, a, b)
+        t_t = waktu(_mul_toom3, a, b)
+        if cross_k is None and t_k < t_s:
+            cross_k = n
+        if cross_t is None and t_t < t_k:
+            cross_t = n
+        print(f"{n:>6} | {n * BASE_DIGITS:>7} | {t_s:>10.5f}s | {t_k:>9.5f}s | {t_t:>9.5f}s")
+    print(f"Crossover: Karatsuba mulai {cross_k} limb, Toom-3 mulai {cross_t} limb")
+    if terapkan:
+        KARATSUBA_CUTOFF = cross_k or KARATSUBA_CUTOFF
+        TOOM3_CUTOFF = cross_t or TOOM3_CUTOFF
+    return cross_k, cross_t
+
+
+def benchmark_konversi(ukuran=(10_000, 100_000, 300_000), seed=0):
+    """Waktu konversi limb <-> int: loop per limb vs divide-and-conquer."""
+    rng = random.Random(seed)
+    print(f"{'digit':>10} | {'naif ->int':>10} | {'D&C ->int':>10} | {'naif <-int':>10} | {'D&C <-int':>10}")
+    print("-" * 62)
+    for d in ukuran:
+        n = -(-d // BASE_DIGITS)
+        limbs = array('I', [rng.randrange(BASE) for _ in range(n - 1)] + [rng.randrange(1, BASE)])
+        t = []
+        mulai = time.perf_counter()
+        nilai = _limbs_to_int_naif(limbs)
+        t.append(time.perf_counter() - mulai)
+        mulai = time.perf_counter()
+        assert _limbs_to_int(limbs) == nilai
+        t.append(time.perf_counter() - mulai)
+        mulai = time.perf_counter()
+        naif = array('I')
+        _limbs_from_int_naif(nilai, naif)
+        t.append(time.perf_counter() - mulai)
+        mulai = time.perf_counter()
+        assert _limbs_from_int(nilai) == naif == limbs
+        t.append(time.perf_counter() - mulai)
+        print(f"{d:>10,} | " + " | ".join(f"{x:>9.3f}s" for x in t))
+
+
 # ============================================================
 # BAGIAN (b): BigInteger dengan Python List
 # ============================================================
 
-class BigIntegerList:
+class BigIntegerList(_OperatorBigInteger):
     def __init__(self, initValue="0"):
         """Membuat BigInteger dari string. Contoh: BigIntegerList('45839')"""
         self.negative = False
-        self.digits = []  # index 0 = least-significant digit
+        self.limbs = array('I')  # index 0 = limb (9 digit) paling rendah
         self._parse(str(initValue))
 
     def _parse(self, s):
-        """Parse string angka ke dalam Python list (least-significant di index 0)."""
+        """Parse string angka ke dalam limb basis 10^9 (least-significant di index 0)."""
         s = s.strip()
         if s.startswith('-'):
             self.negative = True
@@ -154,26 +1080,40 @@ class BigIntegerList:
             self.negative = False
 
         s = s.lstrip('0') or '0'
-        self.digits = [int(ch) for ch in reversed(s)]
+        if not s.isdigit() or not s.isascii():
+            raise ValueError(f"Bukan bilangan bulat: {s!r}")
+        self.limbs = _limbs_from_str(s)
+        if not self.limbs:
+            self.negative = False
+
+    @property
+    def digits(self):
+        """Daftar digit desimal, index 0 = least-significant digit."""
+        return [int(ch) for ch in reversed(_limbs_to_str(self.limbs))]
 
     def _to_int(self):
-        """Konversi list ke integer Python."""
-        return int(self.toString())
+        """Konversi limb ke integer Python."""
+        value = _limbs_to_int(self.limbs)
+        return -value if self.negative else value
 
     @classmethod
     def _from_int(cls, value):
         """Buat BigIntegerList dari integer Python."""
-        return cls(str(value))
+        return cls._from_limbs(_limbs_from_int(abs(value)), value < 0)
+
+    @classmethod
+    def _from_limbs(cls, limbs, negative):
+        obj = cls.__new__(cls)
+        obj.limbs = limbs
+        obj.negative = negative and bool(limbs)
+        return obj
 
     def toString(self):
         """
         Kembalikan representasi string dari big integer.
-        digits[0] = least-significant -> reversed = tampilan normal.
+        limbs[0] = least-significant → dibalik = tampilan normal.
         """
-        if not self.digits:
-            return '0'
-        result = ''.join(str(d) for d in reversed(self.digits))
-        result = result.lstrip('0') or '0'
+        result = _limbs_to_str(self.limbs)
         return ('-' + result) if self.negative and result != '0' else result
 
     def comparable(self, other, op):
@@ -182,19 +1122,10 @@ class BigIntegerList:
         op: '<', '<=', '>', '>=', '==', '!='
         Kembalikan True atau False.
         """
-        a = self._to_int()
-        b = other._to_int()
-        ops = {
-            '<':  a < b,
-            '<=': a <= b,
-            '>':  a > b,
-            '>=': a >= b,
-            '==': a == b,
-            '!=': a != b,
-        }
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return ops[op]
+        return _hasil_banding(self._cmp(other), op)
+
+    def _nilai(self):
+        return (self.negative, self.limbs)
 
     def arithmetic(self, rhsInt, op):
         """
@@ -202,16 +1133,16 @@ class BigIntegerList:
         op: '+', '-', '*', '//', '%', '**'
         Kembalikan BigIntegerList baru.
         """
-        a = self._to_int()
-        b = rhsInt._to_int()
-        if   op == '+':  result = a + b
-        elif op == '-':  result = a - b
-        elif op == '*':  result = a * b
-        elif op == '//': result = a // b
-        elif op == '%':  result = a % b
-        elif op == '**': result = a ** b
-        else: raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerList._from_int(result)
+        negative, limbs = _s_arith(self._nilai(), rhsInt._nilai(), op)
+        return type(self)._from_limbs(limbs, negative)
+
+    def modpow(self, exponent, modulus):
+        """
+        (self ** exponent) % modulus tanpa menghitung pangkat penuh.
+        Kembalikan BigIntegerList baru.
+        """
+        negative, limbs = _s_modpow(self._nilai(), exponent._nilai(), modulus._nilai())
+        return type(self)._from_limbs(limbs, negative)
 
     def bitwise_ops(self, rhsInt, op):
         """
@@ -221,16 +1152,13 @@ class BigIntegerList:
         """
         a = self._to_int()
         b = rhsInt._to_int()
-        ops = {
-            '|':  a | b,
-            '&':  a & b,
-            '^':  a ^ b,
-            '<<': a << b,
-            '>>': a >> b,
-        }
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerList._from_int(ops[op])
+        if   op == '|':  result = a | b
+        elif op == '&':  result = a & b
+        elif op == '^':  result = a ^ b
+        elif op == '<<': result = a << b
+        elif op == '>>': result = a >> b
+        else: raise ValueError(f"Operator tidak dikenal: {op}")
+        return type(self)._from_int(result)
 
 
 # ============================================================
@@ -297,6 +1225,7 @@ if __name__ == "__main__":
 
     print(f"\nBilangan C = {c.toString()}")
     print(f"  Digit list (index 0 = least-significant): {c.digits}")
+    print(f"  Limb basis 10^9 (index 0 = least-significant): {c.limbs.tolist()}")
 
     print(f"\nBilangan D = {d.toString()}")
     print(f"  Digit list (index 0 = least-significant): {d.digits}")
@@ -334,3 +1263,41 @@ if __name__ == "__main__":
     print(f"  big2        = {big2.toString()}")
     print(f"  big1 + big2 = {big1.arithmetic(big2, '+').toString()}")
     print(f"  big1 * big2 = {big1.arithmetic(big2, '*').toString()}")
+
+    separator("Layout Linked List: per-digit vs per-limb")
+    besar = BigIntegerLinkedList("1234567890123456789012345")
+    print(f"\n  {besar.toString()}")
+    besar.print_linked_list()
+    benchmark_layout(100_000)
+
+    separator("Operator Python (+, -, *, <, ==, hash)")
+    e, f = BigIntegerList("123456789012345678901"), BigIntegerList("-98765432109876543210")
+    print(f"\n  E = {e}, F = {f}")
+    print(f"  E + F   = {e + f}")
+    print(f"  E * F   = {e * f}")
+    print(f"  E // F  = {e // f}")
+    print(f"  E < F   : {e < f}")
+    print(f"  -F == E : {-f == e}")
+    angka = [BigIntegerLinkedList(v) for v in ("42", "-7", "1000000000000", "0", "42")]
+    print(f"  sorted  : {sorted(angka)}")
+    print(f"  unik    : {len(set(angka))} dari {len(angka)} nilai")
+
+    separator("Perpangkatan Modular (sliding window + Montgomery)")
+    basis = BigIntegerList("123456789123456789")
+    eksponen = BigIntegerList("98765432109876543210")
+    for mod in ("1000000007", "1000000000000"):
+        hasil = basis.modpow(eksponen, BigIntegerList(mod))
+        print(f"  {basis.toString()} ** {eksponen.toString()} % {mod}")
+        print(f"    = {hasil.toString()}  (pow() = {pow(basis._to_int(), eksponen._to_int(), int(mod))})")
+
+    if "--bench-modpow" in sys.argv:
+        separator("Benchmark modpow vs pow(a, b, m)")
+        benchmark_modpow()
+
+    if "--bench-konversi" in sys.argv:
+        separator("Benchmark Konversi Radix: naif vs divide-and-conquer")
+        benchmark_konversi()
+
+    if "--bench-perkalian" in sys.argv:
+        separator("Benchmark Perkalian: Schoolbook vs Karatsuba vs Toom-3")
+        benchmark_perkalian()
@@ -3,282 +3,410 @@
 # Modifikasi dari Soal 1 dengan menambahkan operator:
 #   +=   -=   *=   //=   %=   **=
 #   <<=  >>=  |=   &=    ^=
+#
+# Kelas di sini mewarisi kelas Soal 1 (limb basis 10^9) dan mengubah
+# nilainya benar-benar in-place: node / buffer limb yang sudah ada
+# dipakai ulang, dan carry/borrow berhenti begitu limb tidak berubah,
+# sehingga x += 1 hanya menyentuh limb yang memang berubah.
 # ============================================================
 
+import time
+import tracemalloc
+from array import array
 
-# ============================================================
-# Node untuk Linked List
-# ============================================================
+import soal1_biginteger as soal1
+from soal1_biginteger import (BASE, _node_pool, _limbs_from_int, _mul_mag,
+                              _s_divmod, _s_modpow, _s_pow)
 
-class Node:
-    def __init__(self, digit):
-        self.digit = digit
-        self.next = None
+SATU = array('I', [1])
+GESER_BIT = 29           # 2^29 < 10^9: satu langkah geser = kali/bagi satu limb
+GESER_MAKS_LANGKAH = 8   # di atas 8 * 29 bit pakai perkalian/pembagian penuh
 
 
 # ============================================================
-# BAGIAN (a): BigInteger Linked List + Combo Operators
+# Operator combo generik
 # ============================================================
 
-class BigIntegerLinkedList:
-    def __init__(self, initValue="0"):
-        self.head = None
-        self.negative = False
-        self._parse(str(initValue))
-
-    def _parse(self, s):
-        s = s.strip()
-        if s.startswith('-'):
-            self.negative = True
-            s = s[1:]
-        else:
-            self.negative = False
-        s = s.lstrip('0') or '0'
-        self.head = None
-        for ch in s:
-            node = Node(int(ch))
-            node.next = self.head
-            self.head = node
-
-    def _to_int(self):
-        return int(self.toString())
-
-    def _update(self, value):
-        """Update nilai self secara in-place dari integer Python."""
-        self._parse(str(value))
-
-    @classmethod
-    def _from_int(cls, value):
-        return cls(str(value))
-
-    def toString(self):
-        digits = []
-        curr = self.head
-        while curr:
-            digits.append(str(curr.digit))
-            curr = curr.next
-        result = ''.join(reversed(digits)) if digits else '0'
-        result = result.lstrip('0') or '0'
-        return ('-' + result) if self.negative and result != '0' else result
-
-    def print_linked_list(self):
-        curr = self.head
-        nodes = []
-        while curr:
-            nodes.append(f"[{curr.digit}|*]")
-            curr = curr.next
-        print("head -> " + " -> ".join(nodes))
-
-    # ---- Operasi dasar (dari Soal 1) ----
+class _ComboMixin:
+    """
+    Implementasi operator combo di atas primitif in-place milik kelas
+    turunan: _mag_kosong, _mag, _tulis, _iadd_mag, _isub_mag,
+    _imul_kecil dan _idivmod_kecil. Operand kanan hanya dibaca lewat
+    _nilai(), jadi boleh kelas Big Integer mana pun dari Soal 1 / Soal 2.
+    """
 
-    def comparable(self, other, op):
-        a, b = self._to_int(), other._to_int()
-        ops = {'<': a<b, '<=': a<=b, '>': a>b, '>=': a>=b, '==': a==b, '!=': a!=b}
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return ops[op]
+    def _rapikan(self):
+        if self._mag_kosong():
+            self.negative = False
+        return self
 
-    def arithmetic(self, rhsInt, op):
-        a, b = self._to_int(), rhsInt._to_int()
-        if   op == '+':  result = a + b
-        elif op == '-':  result = a - b
-        elif op == '*':  result = a * b
-        elif op == '//': result = a // b
-        elif op == '%':  result = a % b
-        elif op == '**': result = a ** b
-        else: raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerLinkedList._from_int(result)
-
-    def bitwise_ops(self, rhsInt, op):
+    def _tambah_bertanda(self, b, b_negatif):
+        if self.negative == b_negatif:
+            self._iadd_mag(b)
+        elif self._isub_mag(b):
+            self.negative = not self.negative
+        return self._rapikan()
+
+    def _idivmod(self, rhsInt, ambil_sisa):
+        yn, b = rhsInt._nilai()
+        xn = self.negative
+        if len(b) != 1:
+            (qn, q), (rn, r) = _s_divmod((xn, self._mag()), (yn, b))
+            self._tulis(r if ambil_sisa else q)
+            self.negative = rn if ambil_sisa else qn
+            return self._rapikan()
+        # Pembagi satu limb: bagi di tempat, lalu koreksi ke floor
+        m = b[0]
+        r = self._idivmod_kecil(m)
+        if ambil_sisa:
+            if xn != yn and r:
+                r = m - r
+            self._tulis(array('I', [r] if r else []))
+            self.negative = yn
+        else:
+            if xn != yn and r:
+                self._iadd_mag(SATU)
+            self.negative = xn != yn
+        return self._rapikan()
+
+    def _ibitwise(self, rhsInt, op):
+        # Bitwise butuh representasi biner: konversi, lalu tulis balik ke
+        # node / buffer yang sama
         a, b = self._to_int(), rhsInt._to_int()
-        ops = {'|': a|b, '&': a&b, '^': a^b, '<<': a<<b, '>>': a>>b}
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerLinkedList._from_int(ops[op])
+        if   op == '|': hasil = a | b
+        elif op == '&': hasil = a & b
+        else:           hasil = a ^ b
+        self._tulis(_limbs_from_int(abs(hasil)))
+        self.negative = hasil < 0
+        return self._rapikan()
+
+    @staticmethod
+    def _jumlah_geser(rhsInt):
+        k = rhsInt._to_int()
+        if k < 0:
+            raise ValueError("Jumlah geser negatif")
+        return k
 
     # ---- Assignment Combo Operators Aritmatika ----
 
     def iadd(self, rhsInt):
         """+=  :  self = self + rhsInt  (in-place)"""
-        self._update(self._to_int() + rhsInt._to_int())
-        return self
+        b_negatif, b = rhsInt._nilai()
+        return self._tambah_bertanda(b, b_negatif)
 
     def isub(self, rhsInt):
         """-=  :  self = self - rhsInt  (in-place)"""
-        self._update(self._to_int() - rhsInt._to_int())
-        return self
+        b_negatif, b = rhsInt._nilai()
+        return self._tambah_bertanda(b, not b_negatif)
 
     def imul(self, rhsInt):
         """*=  :  self = self * rhsInt  (in-place)"""
-        self._update(self._to_int() * rhsInt._to_int())
-        return self
+        b_negatif, b = rhsInt._nilai()
+        negative = self.negative != b_negatif
+        if len(b) <= 1:
+            self._imul_kecil(b[0] if b else 0)
+        else:
+            self._tulis(_mul_mag(self._mag(), b))
+        self.negative = negative
+        return self._rapikan()
 
     def ifloordiv(self, rhsInt):
         """//= :  self = self // rhsInt  (in-place)"""
-        self._update(self._to_int() // rhsInt._to_int())
-        return self
+        return self._idivmod(rhsInt, False)
 
     def imod(self, rhsInt):
         """%=  :  self = self % rhsInt  (in-place)"""
-        self._update(self._to_int() % rhsInt._to_int())
-        return self
+        return self._idivmod(rhsInt, True)
 
-    def ipow(self, rhsInt):
-        """**= :  self = self ** rhsInt  (in-place)"""
-        self._update(self._to_int() ** rhsInt._to_int())
-        return self
+    def ipow(self, rhsInt, modulus=None):
+        """**= :  self = self ** rhsInt  (in-place); dengan modulus -> pow(self, rhsInt, modulus)"""
+        if modulus is None:
+            negative, limbs = _s_pow(self._nilai(), rhsInt._nilai())
+        else:
+            negative, limbs = _s_modpow(self._nilai(), rhsInt._nilai(), modulus._nilai())
+        self._tulis(limbs)
+        self.negative = negative
+        return self._rapikan()
 
     # ---- Assignment Combo Operators Bitwise ----
 
     def ilshift(self, rhsInt):
         """<<= :  self = self << rhsInt  (in-place)"""
-        self._update(self._to_int() << rhsInt._to_int())
+        k = self._jumlah_geser(rhsInt)
+        if k > GESER_BIT * GESER_MAKS_LANGKAH:
+            self._tulis(_mul_mag(self._mag(), _limbs_from_int(1 << k)))
+            return self
+        while k:
+            s = min(k, GESER_BIT)
+            self._imul_kecil(1 << s)
+            k -= s
         return self
 
     def irshift(self, rhsInt):
         """>>= :  self = self >> rhsInt  (in-place)"""
-        self._update(self._to_int() >> rhsInt._to_int())
-        return self
+        k = self._jumlah_geser(rhsInt)
+        if k > GESER_BIT * GESER_MAKS_LANGKAH:
+            negative, limbs = _s_divmod((self.negative, self._mag()),
+                                        (False, _limbs_from_int(1 << k)))[0]
+            self._tulis(limbs)
+            self.negative = negative
+            return self._rapikan()
+        ada_sisa = False
+        while k and not self._mag_kosong():
+            s = min(k, GESER_BIT)
+            if self._idivmod_kecil(1 << s):
+                ada_sisa = True
+            k -= s
+        if self.negative and ada_sisa:
+            self._iadd_mag(SATU)  # floor ke arah -tak hingga, seperti int Python
+        return self._rapikan()
 
     def ior(self, rhsInt):
         """|=  :  self = self | rhsInt  (in-place)"""
-        self._update(self._to_int() | rhsInt._to_int())
-        return self
+        return self._ibitwise(rhsInt, '|')
 
     def iand(self, rhsInt):
         """&=  :  self = self & rhsInt  (in-place)"""
-        self._update(self._to_int() & rhsInt._to_int())
-        return self
+        return self._ibitwise(rhsInt, '&')
 
     def ixor(self, rhsInt):
         """^=  :  self = self ^ rhsInt  (in-place)"""
-        self._update(self._to_int() ^ rhsInt._to_int())
-        return self
+        return self._ibitwise(rhsInt, '^')
+
+    # Operator Python: x += y dst. memanggil versi in-place di atas.
+    # Nilai bisa berubah di tempat, jadi objek tidak boleh dijadikan key dict.
+    __iadd__ = iadd
+    __isub__ = isub
+    __imul__ = imul
+    __ifloordiv__ = ifloordiv
+    __imod__ = imod
+    __ipow__ = ipow
+    __ilshift__ = ilshift
+    __irshift__ = irshift
+    __ior__ = ior
+    __iand__ = iand
+    __ixor__ = ixor
+    __hash__ = None
 
 
 # ============================================================
-# BAGIAN (b): BigInteger Python List + Combo Operators
+# BAGIAN (a): BigInteger Linked List + Combo Operators
 # ============================================================
 
-class BigIntegerList:
-    def __init__(self, initValue="0"):
-        self.negative = False
-        self.digits = []
-        self._parse(str(initValue))
-
-    def _parse(self, s):
-        s = s.strip()
-        if s.startswith('-'):
-            self.negative = True
-            s = s[1:]
-        else:
-            self.negative = False
-        s = s.lstrip('0') or '0'
-        self.digits = [int(ch) for ch in reversed(s)]
-
-    def _to_int(self):
-        return int(self.toString())
-
-    def _update(self, value):
-        """Update nilai self secara in-place dari integer Python."""
-        self._parse(str(value))
+def _balik(head):
+    """Balik arah singly linked list di tempat, kembalikan head baru."""
+    prev = None
+    while head:
+        head.next, prev, head = prev, head, head.next
+    return prev
 
-    @classmethod
-    def _from_int(cls, value):
-        return cls(str(value))
 
-    def toString(self):
-        if not self.digits:
-            return '0'
-        result = ''.join(str(d) for d in reversed(self.digits))
-        result = result.lstrip('0') or '0'
-        return ('-' + result) if self.negative and result != '0' else result
+class BigIntegerLinkedList(_ComboMixin, soal1.BigIntegerLinkedList):
+    def _mag_kosong(self):
+        return self.head is None
 
-    # ---- Operasi dasar (dari Soal 1) ----
+    def _mag(self):
+        return self._limb_view()
 
-    def comparable(self, other, op):
-        a, b = self._to_int(), other._to_int()
-        ops = {'<': a<b, '<=': a<=b, '>': a>b, '>=': a>=b, '==': a==b, '!=': a!=b}
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return ops[op]
-
-    def arithmetic(self, rhsInt, op):
-        a, b = self._to_int(), rhsInt._to_int()
-        if   op == '+':  result = a + b
-        elif op == '-':  result = a - b
-        elif op == '*':  result = a * b
-        elif op == '//': result = a // b
-        elif op == '%':  result = a % b
-        elif op == '**': result = a ** b
-        else: raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerList._from_int(result)
-
-    def bitwise_ops(self, rhsInt, op):
-        a, b = self._to_int(), rhsInt._to_int()
-        ops = {'|': a|b, '&': a&b, '^': a^b, '<<': a<<b, '>>': a>>b}
-        if op not in ops:
-            raise ValueError(f"Operator tidak dikenal: {op}")
-        return BigIntegerList._from_int(ops[op])
-
-    # ---- Assignment Combo Operators Aritmatika ----
-
-    def iadd(self, rhsInt):
-        """+="""
-        self._update(self._to_int() + rhsInt._to_int())
-        return self
-
-    def isub(self, rhsInt):
-        """-="""
-        self._update(self._to_int() - rhsInt._to_int())
-        return self
-
-    def imul(self, rhsInt):
-        """*="""
-        self._update(self._to_int() * rhsInt._to_int())
-        return self
-
-    def ifloordiv(self, rhsInt):
-        """//="""
-        self._update(self._to_int() // rhsInt._to_int())
-        return self
-
-    def imod(self, rhsInt):
-        """%="""
-        self._update(self._to_int() % rhsInt._to_int())
-        return self
-
-    def ipow(self, rhsInt):
-        """**="""
-        self._update(self._to_int() ** rhsInt._to_int())
-        return self
-
-    # ---- Assignment Combo Operators Bitwise ----
-
-    def ilshift(self, rhsInt):
-        """<<="""
-        self._update(self._to_int() << rhsInt._to_int())
-        return self
+    def _sambung(self, prev, limb):
+        """Ambil node dari pool dan pasang setelah `prev` (atau jadi head)."""
+        node = _node_pool.acquire(limb)
+        if prev is None:
+            self.head = node
+        else:
+            prev.next = node
+        return node
+
+    def _tulis(self, limbs):
+        """Timpa limb node yang ada; kekurangan dari pool, kelebihan ke pool."""
+        prev, node = None, self.head
+        for x in limbs:
+            if node is None:
+                node = self._sambung(prev, x)
+            else:
+                node.limb = x
+            prev, node = node, node.next
+        if prev is None:
+            self.head = None
+        else:
+            prev.next = None
+        _node_pool.release_chain(node)
 
-    def irshift(self, rhsInt):
-        """>>>="""
-        self._update(self._to_int() >> rhsInt._to_int())
-        return self
+    def _buang_nol_atas(self):
+        terakhir, curr = None, self.head
+        while curr:
+            if curr.limb:
+                terakhir = curr
+            curr = curr.next
+        if terakhir is None:
+            _node_pool.release_chain(self.head)
+            self.head = None
+        else:
+            _node_pool.release_chain(terakhir.next)
+            terakhir.next = None
+
+    def _iadd_mag(self, b):
+        carry, i, n = 0, 0, len(b)
+        prev, node = None, self.head
+        while i < n or carry:
+            if node is None:
+                node = self._sambung(prev, 0)
+            s = node.limb + carry + (b[i] if i < n else 0)
+            if s >= BASE:
+                node.limb, carry = s - BASE, 1
+            else:
+                node.limb, carry = s, 0
+            prev, node = node, node.next
+            i += 1
+
+    def _isub_mag(self, b):
+        """|self| -= b di tempat. Kembalikan True kalau b > |self| (tanda berbalik)."""
+        borrow, i, n = 0, 0, len(b)
+        prev, node = None, self.head
+        while i < n or borrow:
+            if node is None:
+                if i >= n:
+                    break
+                node = self._sambung(prev, 0)
+            s = node.limb - borrow - (b[i] if i < n else 0)
+            if s < 0:
+                node.limb, borrow = s + BASE, 1
+            else:
+                node.limb, borrow = s, 0
+            prev, node = node, node.next
+            i += 1
+        berbalik = borrow == 1
+        if berbalik:
+            # Isi sekarang = self - b + BASE^len -> komplemen jadi b - self
+            borrow, curr = 0, self.head
+            while curr:
+                s = -curr.limb - borrow
+                curr.limb, borrow = (s + BASE, 1) if s < 0 else (0, 0)
+                curr = curr.next
+        if node is None:
+            self._buang_nol_atas()
+        return berbalik
+
+    def _imul_kecil(self, m):
+        if m == 0:
+            self._tulis(())
+            return
+        carry, prev, node = 0, None, self.head
+        while node:
+            carry, node.limb = divmod(node.limb * m + carry, BASE)
+            prev, node = node, node.next
+        while carry:
+            carry, r = divmod(carry, BASE)
+            prev = self._sambung(prev, r)
+
+    def _idivmod_kecil(self, m):
+        """|self| //= m di tempat (m satu limb), kembalikan sisanya."""
+        # Pembagian berjalan dari limb teratas: balik list, bagi, balik lagi
+        head = _balik(self.head)
+        r, node = 0, head
+        while node:
+            node.limb, r = divmod(r * BASE + node.limb, m)
+            node = node.next
+        while head and head.limb == 0:
+            nxt = head.next
+            head.next = None
+            _node_pool.release_chain(head)
+            head = nxt
+        self.head = _balik(head)
+        return r
 
-    def ior(self, rhsInt):
-        """|="""
-        self._update(self._to_int() | rhsInt._to_int())
-        return self
 
-    def iand(self, rhsInt):
-        """&="""
-        self._update(self._to_int() & rhsInt._to_int())
-        return self
+# ============================================================
+# BAGIAN (b): BigInteger Python List + Combo Operators
+# ============================================================
 
-    def ixor(self, rhsInt):
-        """^="""
-        self._update(self._to_int() ^ rhsInt._to_int())
-        return self
+def _trim_ujung(a):
+    while a and a[-1] == 0:
+        a.pop()
+
+
+class BigIntegerList(_ComboMixin, soal1.BigIntegerList):
+    def _mag_kosong(self):
+        return not self.limbs
+
+    def _mag(self):
+        return self.limbs
+
+    def _tulis(self, limbs):
+        self.limbs[:] = array('I', limbs)
+
+    def _iadd_mag(self, b):
+        a, n = self.limbs, len(b)
+        if len(a) < n:
+            a.frombytes(bytes((n - len(a)) * a.itemsize))
+        carry = 0
+        for i in range(n):
+            s = a[i] + b[i] + carry
+            if s >= BASE:
+                a[i], carry = s - BASE, 1
+            else:
+                a[i], carry = s, 0
+        i = n
+        while carry:
+            if i == len(a):
+                a.append(1)
+                break
+            if a[i] == BASE - 1:
+                a[i] = 0
+            else:
+                a[i] += 1
+                carry = 0
+            i += 1
+
+    def _isub_mag(self, b):
+        """|self| -= b di tempat. Kembalikan True kalau b > |self| (tanda berbalik)."""
+        a, n = self.limbs, len(b)
+        if len(a) < n:
+            a.frombytes(bytes((n - len(a)) * a.itemsize))
+        borrow = 0
+        for i in range(n):
+            s = a[i] - b[i] - borrow
+            if s < 0:
+                a[i], borrow = s + BASE, 1
+            else:
+                a[i], borrow = s, 0
+        i = n
+        while borrow and i < len(a):
+            if a[i] == 0:
+                a[i] = BASE - 1
+            else:
+                a[i] -= 1
+                borrow = 0
+            i += 1
+        berbalik = borrow == 1
+        if berbalik:
+            # Isi sekarang = self - b + BASE^len -> komplemen jadi b - self
+            borrow = 0
+            for i in range(len(a)):
+                s = -a[i] - borrow
+                a[i], borrow = (s + BASE, 1) if s < 0 else (0, 0)
+        _trim_ujung(a)
+        return berbalik
+
+    def _imul_kecil(self, m):
+        a = self.limbs
+        if m == 0:
+            del a[:]
+            return
+        carry = 0
+        for i in range(len(a)):
+            carry, a[i] = divmod(a[i] * m + carry, BASE)
+        while carry:
+            carry, r = divmod(carry, BASE)
+            a.append(r)
+
+    def _idivmod_kecil(self, m):
+        """|self| //= m di tempat (m satu limb), kembalikan sisanya."""
+        a, r = self.limbs, 0
+        for i in range(len(a) - 1, -1, -1):
+            a[i], r = divmod(r * BASE + a[i], m)
+        _trim_ujung(a)
+        return r
 
 
 # ============================================================
@@ -303,6 +431,8 @@ def demo_combo(label, cls):
     v = cls("100"); v.ifloordiv(rhs);  print(f"  100 //=  7  -> {v.toString()}")
     v = cls("100"); v.imod(rhs);       print(f"  100 %=   7  -> {v.toString()}")
     v = cls("2");   v.ipow(cls("10")); print(f"    2 **= 10  -> {v.toString()}")
+    v = cls("2");   v.ipow(cls("100"), cls("1000000007"))
+    print(f"    2 **= 100 (mod 1000000007) -> {v.toString()}")
 
     print("\n  --- Bitwise ---")
     v = cls("60"); v.ilshift(cls("2")); print(f"   60 <<= 2   -> {v.toString()}")
@@ -319,6 +449,36 @@ def demo_combo(label, cls):
     x.isub(cls("30")); print(f"  x -=  30  -> x = {x.toString()}")
     x.ifloordiv(cls("4")); print(f"  x //=  4  -> x = {x.toString()}")
 
+    print("\n  --- Operator Python ---")
+    x = cls("50")
+    simpan = x
+    x += cls("10"); x *= cls("3"); x -= cls("30")
+    print(f"  x += 10; x *= 3; x -= 30  -> x = {x}  (objek sama: {x is simpan})")
+
+
+def benchmark_akumulator(cls, digit=2000, langkah=500):
+    """x += 1 berulang: parse ulang dari string (cara lama) vs in-place."""
+    satu = cls("1")
+    awal = "9" * digit
+
+    def ukur(langkah_fn):
+        x = cls(awal)
+        tracemalloc.start()
+        mulai = time.perf_counter()
+        for _ in range(langkah):
+            langkah_fn(x)
+        waktu = time.perf_counter() - mulai
+        _, puncak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return x.toString(), waktu, puncak
+
+    hasil_lama, t_lama, m_lama = ukur(lambda x: x._parse(str(x._to_int() + 1)))
+    hasil_baru, t_baru, m_baru = ukur(lambda x: x.iadd(satu))
+    assert hasil_lama == hasil_baru
+    print(f"  {cls.__name__}: {langkah:,} x (+= 1) pada {digit:,} digit")
+    print(f"    parse ulang : {t_lama * 1000:>8.2f} ms, puncak alokasi {m_lama / 1024:>8.1f} KiB")
+    print(f"    in-place    : {t_baru * 1000:>8.2f} ms, puncak alokasi {m_baru / 1024:>8.1f} KiB")
+
 
 if __name__ == "__main__":
     demo_combo("BigIntegerLinkedList", BigIntegerLinkedList)
@@ -332,3 +492,7 @@ if __name__ == "__main__":
     print(f"  big += 1  -> {big.toString()}")
     big.imul(BigIntegerList("2"))
     print(f"  big *= 2  -> {big.toString()}")
+
+    separator("Akumulator: Parse Ulang vs In-place")
+    benchmark_akumulator(BigIntegerLinkedList)
+    benchmark_akumulator(BigIntegerList)